@@ -1,165 +1,266 @@
-from core.table_model import TableModel
-from typing import List, Tuple, Optional
+from core.table_model import TableModel, BOLD, ITALIC, MERGED, HEADER
+from typing import Dict, List, Tuple, Optional
+
+
+# LaTeX special characters and their escaped forms (applied in a single translate pass)
+_ESCAPE_TABLE = str.maketrans({
+    '&': '\\&',
+    '%': '\\%',
+    '$': '\\$',
+    '#': '\\#',
+    '^': '\\textasciicircum{}',
+    '_': '\\_',
+    '{': '\\{',
+    '}': '\\}',
+    '~': '\\textasciitilde{}',
+    '\\': '\\textbackslash{}'
+})
+
+# RH' logic: thick header separators, anything else falls back to a single line
+_LINE_COMMANDS = {
+    "double": "\\hline\\hline",  # RH' = 2 hlines
+    "single": "\\hline",          # RH' = 1 hline
+}
+_COLUMN_LINE_STYLES = {
+    "double": "||",  # RH' = 2 vlines
+    "single": "|",   # RH' = 1 vline
+}
 
 
 class LaTeXGenerator:
+    __slots__ = ('table_model', 'table_style', '_header_row_bnd', '_header_col_bnd',
+                 '_column_alignments', '_grid', '_hdr_rows', '_hdr_cols', '_hdr_mask', '_default_fonts',
+                 '_dispatch', '_has_multirow_cache', '_header_counts_cache')
+    
+    # Fixed longtable boilerplate surrounding the repeated header row
+    _LONGTABLE_FIRSTHEAD = ("\\hline", "\\endfirsthead", "", "\\hline")
+    _LONGTABLE_HEAD_FOOT = ("\\hline", "\\endhead", "",
+                            "\\hline", "\\endfoot", "",
+                            "\\hline", "\\endlastfoot", "")
+    
+    # LaTeX package availability, shared by all generators (probing runs pdflatex)
+    _PKG_AVAIL_CACHE: Dict[str, bool] = {}
+    
     def __init__(self, table_model: TableModel, table_style=None):
         self.table_model = table_model
         self.table_style = table_style
+        self._header_row_bnd: tuple = ()
+        self._header_col_bnd: tuple = ()
+        self._column_alignments: List[Optional[str]] = []
+        # Row-major snapshot of the model's cells, valid during a generate() call
+        self._grid: Optional[list] = None
+        # Per-generate() header row/column index sets and (header, data) default fonts
+        self._hdr_rows: Optional[frozenset] = None
+        self._hdr_cols: Optional[frozenset] = None
+        self._hdr_mask: Optional[Tuple[Tuple[bool, ...], ...]] = None
+        self._default_fonts: Optional[Tuple[str, str]] = None
+        # Style name -> generator; unknown styles fall back to tabular
+        self._dispatch = {
+            "tabular": self._generate_tabular,
+            "longtable": self._generate_longtable,
+            "booktabs": self._generate_booktabs,
+            "array": self._generate_array,
+            "styled": self._generate_styled_table,
+        }
+        # (model version, result) pairs for whole-table scans
+        self._has_multirow_cache: Optional[Tuple[int, bool]] = None
+        self._header_counts_cache: Optional[Tuple[int, Tuple[int, int]]] = None
+    
+    def set_style(self, table_style=None):
+        """Use a different table style (or none) for later generate() calls"""
+        self.table_style = table_style
     
     def generate(self, style: str = "tabular") -> str:
-        if style == "tabular":
-            return self._generate_tabular()
-        elif style == "longtable":
-            return self._generate_longtable()
-        elif style == "booktabs":
-            return self._generate_booktabs()
-        elif style == "array":
-            return self._generate_array()
-        elif style == "styled":
-            return self._generate_styled_table()
-        else:
-            return self._generate_tabular()
+        self._grid = self._snapshot()
+        self._hdr_rows, self._hdr_cols = self._get_header_sets()
+        self._hdr_mask = self.table_model.header_mask()
+        self._default_fonts = self._get_default_fonts()
+        try:
+            return self._dispatch.get(style, self._generate_tabular)()
+        finally:
+            self._grid = None
+            self._hdr_rows = self._hdr_cols = None
+            self._hdr_mask = None
+            self._default_fonts = None
+    
+    def _snapshot(self) -> list:
+        """Copy the model's cells into a row-major 2D list"""
+        get_cell = self.table_model.get_cell
+        cols = range(self.table_model.cols)
+        return [[get_cell(row, col) for col in cols] for row in range(self.table_model.rows)]
+    
+    def _get_grid(self) -> list:
+        """Return the snapshot of the current generate() call, or a fresh one"""
+        grid = self._grid
+        if grid is None:
+            grid = self._snapshot()
+        return grid
     
     def _generate_styled_table(self) -> str:
         """Generate a LaTeX table using the custom style settings"""
-        if not self.table_style:
+        style = self.table_style
+        if not style:
             return self._generate_tabular()
         
+        # Precompute header boundaries once instead of per row/column
+        self._header_row_bnd, self._header_col_bnd = self._compute_header_boundaries()
+        
+        rows = self.table_model.rows
+        generate_styled_row = self._generate_styled_row
+        get_line_command = self._get_line_command
+        row_bnd = self._header_row_bnd
+        header_rows_thick = style.header_rows_thick
+        header_rows_style = style.header_rows_style
+        all_rows_lines = style.all_rows_lines
+        has_title = style.include_title and style.title_text
+        
         lines = []
         
         # Add title if requested
-        if self.table_style.include_title and self.table_style.title_text:
+        if has_title:
             lines.append("\\begin{table}[htbp]")
             lines.append("\\centering")
-            lines.append(f"\\caption{{{self.table_style.title_text}}}")
+            lines.append(f"\\caption{{{style.title_text}}}")
         
         # Generate column specification with borders
         col_spec = self._get_styled_column_spec()
         lines.append(f"\\begin{{tabular}}{{{col_spec}}}")
         
         # Add top border
-        if self.table_style.top_bottom_borders:
-            lines.append(self._get_line_command("normal"))
+        if style.top_bottom_borders:
+            lines.append(get_line_command("normal"))
         
         # Generate table rows
-        for row_idx in range(self.table_model.rows):
+        for row_idx in range(rows):
             # Generate the row content first
-            row_latex = self._generate_styled_row(row_idx)
+            row_latex = generate_styled_row(row_idx)
             lines.append(row_latex)
             
             # Add line after the row (except for the last row) - Apply RH Logic
-            if row_idx < self.table_model.rows - 1:
+            if row_idx < rows - 1:
                 # Check if this is after a header row
-                is_after_header = self._is_header_row_boundary(row_idx + 1)
+                is_after_header = row_bnd[row_idx]
                 
-                if is_after_header and self.table_style.header_rows_thick:
+                if is_after_header and header_rows_thick:
                     # Case 4: Header thick ON + Headers set → Always double line (ignore RH)
-                    lines.append(self._get_line_command(self.table_style.header_rows_style))
-                elif self.table_style.all_rows_lines:
+                    lines.append(get_line_command(header_rows_style))
+                elif all_rows_lines:
                     # Cases 1,2,3: Follow RH logic (1 hline when all_rows_lines is ON)
-                    lines.append(self._get_line_command("normal"))
+                    lines.append(get_line_command("normal"))
                 # If all_rows_lines is OFF and not case 4, add no lines (RH = 0 hlines)
         
         # Add bottom border
-        if self.table_style.top_bottom_borders:
-            lines.append(self._get_line_command("normal"))
+        if style.top_bottom_borders:
+            lines.append(get_line_command("normal"))
         
         lines.append("\\end{tabular}")
         
         # Close table environment if title was added
-        if self.table_style.include_title and self.table_style.title_text:
+        if has_title:
             lines.append("\\end{table}")
         
         return "\n".join(lines)
     
     def _get_styled_column_spec(self) -> str:
         """Generate column specification with custom styling"""
+        style = self.table_style
+        cols = self.table_model.cols
+        col_bnd = self._header_col_bnd
+        header_columns_thick = style.header_columns_thick
+        all_columns_lines = style.all_columns_lines
         specs = []
+        self._column_alignments = alignments = self._compute_column_alignments()
         
         # Add left border if requested
-        if self.table_style.left_right_borders:
+        if style.left_right_borders:
             specs.append("|")
         
-        for col in range(self.table_model.cols):
+        for col in range(cols):
             # Get column alignment
-            alignment = self._get_column_alignment(col)
+            alignment = alignments[col]
+            if alignment is None:
+                alignment = "c"  # Default to center
             specs.append(alignment)
             
             # Add column separator - Apply RH Logic for vertical lines
-            if col < self.table_model.cols - 1:
+            if col < cols - 1:
                 # Check if this is after a header column
-                is_after_header_col = self._is_header_column_boundary(col + 1)
+                is_after_header_col = col_bnd[col]
                 
-                if is_after_header_col and self.table_style.header_columns_thick:
+                if is_after_header_col and header_columns_thick:
                     # Case 4: Header column thick ON + Headers set → Always double line (ignore RH)
-                    specs.append(self._get_column_line_style(self.table_style.header_columns_style))
-                elif self.table_style.all_columns_lines:
+                    specs.append(self._get_column_line_style(style.header_columns_style))
+                elif all_columns_lines:
                     # Cases 1,2,3: Follow RH logic (1 vline when all_columns_lines is ON)
                     specs.append("|")
                 # If all_columns_lines is OFF and not case 4, add no lines (RH = 0 vlines)
         
         # Add right border if requested
-        if self.table_style.left_right_borders:
+        if style.left_right_borders:
             specs.append("|")
         
         return "".join(specs)
     
-    def _get_column_alignment(self, col: int) -> str:
-        """Get the alignment for a specific column"""
-        for row in range(self.table_model.rows):
-            cell = self.table_model.get_cell(row, col)
-            if cell and cell.content and not cell.is_merged_part:
-                return cell.alignment
-        return "c"  # Default to center
+    def _compute_column_alignments(self) -> List[Optional[str]]:
+        """Find each column's alignment in a single row-major pass
+        Returns the alignment of the first non-empty, non-merged cell per column, or None
+        """
+        cols = self.table_model.cols
+        alignments: List[Optional[str]] = [None] * cols
+        remaining = cols
+        
+        for row_cells in self._get_grid():
+            if not remaining:
+                break
+            for col in range(cols):
+                if alignments[col] is not None:
+                    continue
+                cell = row_cells[col]
+                if cell and cell.content and not cell.flags & MERGED:
+                    alignments[col] = cell.alignment
+                    remaining -= 1
+        
+        return alignments
     
     def _get_line_command(self, line_style: str) -> str:
         """Get the appropriate LaTeX line command - RH' Logic"""
-        if line_style == "double":
-            return "\\hline\\hline"  # RH' = 2 hlines
-        elif line_style == "single":
-            return "\\hline"        # RH' = 1 hline
-        else:
-            return "\\hline"        # Default = 1 hline
+        return _LINE_COMMANDS.get(line_style, "\\hline")  # Default = 1 hline
     
     def _get_column_line_style(self, line_style: str) -> str:
         """Get column line separator for thick styles - RH' Logic"""
-        if line_style == "double":
-            return "||"  # RH' = 2 vlines
-        elif line_style == "single":
-            return "|"   # RH' = 1 vline
-        else:
-            return "|"   # Default = 1 vline
+        return _COLUMN_LINE_STYLES.get(line_style, "|")  # Default = 1 vline
     
     def _generate_styled_row(self, row_idx: int) -> str:
         """Generate a single row with custom styling"""
+        cols = self.table_model.cols
+        row_cells = self._get_grid()[row_idx]
+        apply_font_formatting = self._apply_font_formatting
         cells = []
+        add_cell = cells.append
         col_idx = 0
         
-        while col_idx < self.table_model.cols:
-            cell = self.table_model.get_cell(row_idx, col_idx)
+        while col_idx < cols:
+            cell = row_cells[col_idx]
             
-            if not cell or cell.is_merged_part:
+            if not cell or cell.flags & MERGED:
                 col_idx += 1
                 continue
             
-            content = cell.content
-            
             # Apply formatting based on explicit font style or default settings
-            content = self._apply_font_formatting(content, cell, row_idx, col_idx)
+            content = apply_font_formatting(cell.content, cell, row_idx, col_idx)
             
             # Handle merged cells
-            if cell.span.row_span > 1 or cell.span.col_span > 1:
-                if cell.span.col_span > 1:
-                    content = f"\\multicolumn{{{cell.span.col_span}}}{{{cell.alignment}}}{{{content}}}"
-                if cell.span.row_span > 1:
-                    content = f"\\multirow{{{cell.span.row_span}}}{{*}}{{{content}}}"
-                
-                col_idx += cell.span.col_span
+            row_span = cell.span.row_span
+            col_span = cell.span.col_span
+            if col_span > 1:
+                content = "\\multicolumn{" + str(col_span) + "}{" + cell.alignment + "}{" + content + "}"
+                col_idx += col_span
             else:
                 col_idx += 1
+            if row_span > 1:
+                content = "\\multirow{" + str(row_span) + "}{*}{" + content + "}"
             
-            cells.append(content)
+            add_cell(content)
         
         return " & ".join(cells) + " \\\\"
     
@@ -167,28 +268,31 @@ class LaTeXGenerator:
         """Count total header cells in row direction vs column direction
         Returns: (row_direction_count, column_direction_count)
         """
-        row_direction_count = 0
-        column_direction_count = 0
-        
-        for row in range(self.table_model.rows):
-            for col in range(self.table_model.cols):
-                cell = self.table_model.get_cell(row, col)
-                if cell and cell.is_header:
-                    row_direction_count += 1
-                    column_direction_count += 1
+        version = self.table_model.version
+        if self._header_counts_cache and self._header_counts_cache[0] == version:
+            return self._header_counts_cache[1]
         
         # Count how many rows have headers vs how many columns have headers
         header_rows = set()
         header_cols = set()
         
-        for row in range(self.table_model.rows):
-            for col in range(self.table_model.cols):
-                cell = self.table_model.get_cell(row, col)
-                if cell and cell.is_header:
-                    header_rows.add(row)
-                    header_cols.add(col)
+        cols = self.table_model.cols
         
-        return len(header_rows), len(header_cols)
+        for row, row_cells in enumerate(self._get_grid()):
+            if len(header_cols) == cols:
+                # Every column is already counted; only need to know whether this row has a header
+                if any(cell and cell.flags & HEADER for cell in row_cells):
+                    header_rows.add(row)
+                continue
+            
+            row_header_cols = [col for col, cell in enumerate(row_cells) if cell and cell.flags & HEADER]
+            if row_header_cols:
+                header_rows.add(row)
+                header_cols.update(row_header_cols)
+        
+        counts = (len(header_rows), len(header_cols))
+        self._header_counts_cache = (version, counts)
+        return counts
     
     def _get_header_priority_direction(self) -> str:
         """Determine which direction should get header line priority
@@ -206,77 +310,84 @@ class LaTeXGenerator:
             # Equal count - default to row priority
             return 'row'
     
-    def _is_header_row_boundary(self, row_idx: int) -> bool:
-        """Check if this row is a boundary after header rows using explicit header specification"""
-        if row_idx == 0:
-            return False
+    def _compute_header_boundaries(self) -> Tuple[tuple, tuple]:
+        """Build header boundary flags for all rows and columns in one pass
+        Returns: (row_boundaries, column_boundaries) where index i means a boundary after row/column i
+        """
+        header_row_set, header_col_set = self._get_header_sets()
+        header_rows = tuple(i in header_row_set for i in range(self.table_model.rows))
+        header_cols = tuple(i in header_col_set for i in range(self.table_model.cols))
         
-        # Use explicit header specification instead of cell-by-cell detection
-        prev_row_is_header = self.table_model.is_header_row(row_idx - 1)
-        curr_row_is_header = self.table_model.is_header_row(row_idx)
+        row_bnd = tuple(header_rows[i - 1] and not header_rows[i] for i in range(1, len(header_rows)))
+        col_bnd = tuple(header_cols[i - 1] and not header_cols[i] for i in range(1, len(header_cols)))
         
-        return prev_row_is_header and not curr_row_is_header
+        return row_bnd, col_bnd
     
-    def _is_header_column_boundary(self, col_idx: int) -> bool:
-        """Check if this column is a boundary after header columns using explicit header specification"""
-        if col_idx == 0:
-            return False
-        
-        # Use explicit header specification instead of cell-by-cell detection
-        prev_col_is_header = self.table_model.is_header_col(col_idx - 1)
-        curr_col_is_header = self.table_model.is_header_col(col_idx)
-        
-        return prev_col_is_header and not curr_col_is_header
+    def _get_header_sets(self) -> Tuple[frozenset, frozenset]:
+        """Get (header_rows, header_cols) index sets from the generate() call or the model's cache"""
+        if self._hdr_rows is not None:
+            return self._hdr_rows, self._hdr_cols
+        return (self.table_model._get_header_row_set(),
+                self.table_model._get_header_col_set())
+    
+    def _get_default_fonts(self) -> Optional[Tuple[str, str]]:
+        """Get (header_default_font, data_default_font) from the table style, if it defines them"""
+        if self.table_style and hasattr(self.table_style, 'header_default_font'):
+            return (self.table_style.header_default_font,
+                    getattr(self.table_style, 'data_default_font', None))
+        return None
     
     def _apply_font_formatting(self, content: str, cell, row: int, col: int) -> str:
         """Apply font formatting based on explicit style or default settings"""
         # First check if cell has explicit formatting
-        if cell.is_bold or cell.font_style == "bold":
+        font_style = cell.font_style
+        flags = cell.flags
+        if flags & BOLD or font_style == "bold":
             return f"\\textbf{{{content}}}"
-        elif cell.is_italic or cell.font_style == "italic":
+        elif flags & ITALIC or font_style == "italic":
             return f"\\textit{{{content}}}"
-        elif cell.font_style == "normal":
+        elif font_style == "normal":
             # Explicitly set to normal, don't apply defaults
             return content
         
         # If no explicit formatting (empty font_style) and we have table style, apply defaults
-        if cell.font_style == "" and self.table_style and hasattr(self.table_style, 'header_default_font'):
-            is_header_cell = self.table_model.is_header_cell(row, col)
+        if font_style == "":
+            hdr_mask = self._hdr_mask
+            if hdr_mask is None:
+                # Called outside generate(), nothing precomputed
+                default_fonts = self._get_default_fonts()
+                is_header_cell = default_fonts and self.table_model.is_header_cell(row, col)
+            else:
+                default_fonts = self._default_fonts
+                is_header_cell = hdr_mask[row][col]
             
-            if is_header_cell and self.table_style.header_default_font == "bold":
-                return f"\\textbf{{{content}}}"
-            elif is_header_cell and self.table_style.header_default_font == "italic":
-                return f"\\textit{{{content}}}"
-            elif not is_header_cell and self.table_style.data_default_font == "bold":
-                return f"\\textbf{{{content}}}"
-            elif not is_header_cell and self.table_style.data_default_font == "italic":
-                return f"\\textit{{{content}}}"
+            if default_fonts:
+                default_font = default_fonts[0] if is_header_cell else default_fonts[1]
+                if default_font == "bold":
+                    return f"\\textbf{{{content}}}"
+                elif default_font == "italic":
+                    return f"\\textit{{{content}}}"
         
         # No formatting applied
         return content
     
     def _get_column_spec(self) -> str:
-        column_specs = []
-        for col in range(self.table_model.cols):
-            alignment = 'l'
-            for row in range(self.table_model.rows):
-                cell = self.table_model.get_cell(row, col)
-                if cell and cell.content and not cell.is_merged_part:
-                    alignment = cell.alignment
-                    break
-            column_specs.append(alignment)
-        return ''.join(column_specs)
+        self._column_alignments = self._compute_column_alignments()
+        return ''.join('l' if alignment is None else alignment
+                       for alignment in self._column_alignments)
     
     def _generate_tabular(self) -> str:
         column_spec = self._get_column_spec()
         
+        generate_row = self._generate_row
+        
         lines = [
             "\\begin{tabular}{" + column_spec + "}",
             "\\hline"
         ]
         
         for row in range(self.table_model.rows):
-            row_content = self._generate_row(row)
+            row_content = generate_row(row)
             if row_content:
                 lines.append(row_content + " \\\\")
                 lines.append("\\hline")
@@ -292,29 +403,20 @@ class LaTeXGenerator:
             "\\hline"
         ]
         
-        if self.table_model.rows > 0:
-            header_row = self._generate_row(0)
+        rows = self.table_model.rows
+        generate_row = self._generate_row
+        
+        if rows > 0:
+            header_row = generate_row(0)
             if header_row:
-                lines.extend([
-                    header_row + " \\\\",
-                    "\\hline",
-                    "\\endfirsthead",
-                    "",
-                    "\\hline",
-                    header_row + " \\\\",
-                    "\\hline",
-                    "\\endhead",
-                    "",
-                    "\\hline",
-                    "\\endfoot",
-                    "",
-                    "\\hline",
-                    "\\endlastfoot",
-                    ""
-                ])
+                header_line = header_row + " \\\\"
+                lines.append(header_line)
+                lines.extend(self._LONGTABLE_FIRSTHEAD)
+                lines.append(header_line)
+                lines.extend(self._LONGTABLE_HEAD_FOOT)
                 
-                for row in range(1, self.table_model.rows):
-                    row_content = self._generate_row(row)
+                for row in range(1, rows):
+                    row_content = generate_row(row)
                     if row_content:
                         lines.append(row_content + " \\\\")
                         lines.append("\\hline")
@@ -324,27 +426,25 @@ class LaTeXGenerator:
     
     def _generate_booktabs(self) -> str:
         # Check if booktabs package is available, fallback to tabular if not
-        try:
-            from utils.latex_packages import is_latex_package_available
-            if not is_latex_package_available('booktabs'):
-                # Fallback to regular tabular with hlines
-                return self._generate_tabular()
-        except ImportError:
-            # If package detection fails, use regular tabular
+        if not self._is_package_available('booktabs', default=False):
+            # Fallback to regular tabular with hlines (also used if package detection fails)
             return self._generate_tabular()
         
         column_spec = self._get_column_spec()
         
+        rows = self.table_model.rows
+        generate_row = self._generate_row
+        
         lines = [
             "\\begin{tabular}{" + column_spec + "}",
             "\\toprule"
         ]
         
-        for row in range(self.table_model.rows):
-            row_content = self._generate_row(row)
+        for row in range(rows):
+            row_content = generate_row(row)
             if row_content:
                 lines.append(row_content + " \\\\")
-                if row == 0 and self.table_model.rows > 1:
+                if row == 0 and rows > 1:
                     # After header row, use midrule
                     lines.append("\\midrule")
                 # No lines between data rows in IEEE style
@@ -356,14 +456,17 @@ class LaTeXGenerator:
     def _generate_array(self) -> str:
         column_spec = self._get_column_spec()
         
+        rows = self.table_model.rows
+        generate_row = self._generate_row
+        
         lines = [
             "\\begin{array}{" + column_spec + "}"
         ]
         
-        for row in range(self.table_model.rows):
-            row_content = self._generate_row(row)
+        for row in range(rows):
+            row_content = generate_row(row)
             if row_content:
-                if row < self.table_model.rows - 1:
+                if row < rows - 1:
                     lines.append(row_content + " \\\\")
                 else:
                     lines.append(row_content)
@@ -372,69 +475,70 @@ class LaTeXGenerator:
         return '\n'.join(lines)
     
     def _generate_row(self, row: int) -> str:
+        cols = self.table_model.cols
+        row_cells = self._get_grid()[row]
+        escape_latex = self._escape_latex
+        apply_font_formatting = self._apply_font_formatting
+        multirow_available = None  # Resolved on the first multirow cell
         cells = []
+        add_cell = cells.append
         col = 0
         
-        while col < self.table_model.cols:
-            cell = self.table_model.get_cell(row, col)
+        while col < cols:
+            cell = row_cells[col]
             
             if not cell:
-                cells.append("")
+                add_cell("")
                 col += 1
                 continue
             
-            if cell.is_merged_part:
+            if cell.flags & MERGED:
                 col += 1
                 continue
             
-            content = self._escape_latex(cell.content)
+            content = escape_latex(cell.content)
             
             # Apply formatting based on explicit font style or default settings
-            content = self._apply_font_formatting(content, cell, row, col)
+            content = apply_font_formatting(content, cell, row, col)
             
             if cell.span.col_span > 1:
                 content = f"\\multicolumn{{{cell.span.col_span}}}{{{cell.alignment}}}{{{content}}}"
                 
             if cell.span.row_span > 1:
                 # Check if multirow package is available
-                try:
-                    from utils.latex_packages import is_latex_package_available
-                    if is_latex_package_available('multirow'):
-                        content = f"\\multirow{{{cell.span.row_span}}}{{*}}{{{content}}}"
-                    # If multirow is not available, just use the content as-is
-                    # (not perfect but better than failing to compile)
-                except ImportError:
-                    pass
+                if multirow_available is None:
+                    multirow_available = self._is_package_available('multirow', default=False)
+                if multirow_available:
+                    content = f"\\multirow{{{cell.span.row_span}}}{{*}}{{{content}}}"
+                # If multirow is not available, just use the content as-is
+                # (not perfect but better than failing to compile)
             
-            cells.append(content)
+            add_cell(content)
             col += cell.span.col_span
         
         # Don't pad with empty cells when we have multicolumn spans
         # The multicolumn command already accounts for the spanned columns
         return " & ".join(cells)
     
+    def _is_package_available(self, package_name: str, default: bool) -> bool:
+        """Check LaTeX package availability once per process
+        Returns default if package detection cannot be imported
+        """
+        available = LaTeXGenerator._PKG_AVAIL_CACHE.get(package_name)
+        if available is None:
+            try:
+                from utils.latex_packages import is_latex_package_available
+                available = is_latex_package_available(package_name)
+            except ImportError:
+                available = default
+            LaTeXGenerator._PKG_AVAIL_CACHE[package_name] = available
+        return available
+    
     def _escape_latex(self, text: str) -> str:
         if not text:
             return ""
         
-        escape_chars = {
-            '&': '\\&',
-            '%': '\\%',
-            '$': '\\$',
-            '#': '\\#',
-            '^': '\\textasciicircum{}',
-            '_': '\\_',
-            '{': '\\{',
-            '}': '\\}',
-            '~': '\\textasciitilde{}',
-            '\\': '\\textbackslash{}'
-        }
-        
-        result = text
-        for char, escaped in escape_chars.items():
-            result = result.replace(char, escaped)
-        
-        return result
+        return text.translate(_ESCAPE_TABLE)
     
     def generate_complete_document(self, style: str = "tabular", 
                                  document_class: str = "article",
@@ -475,12 +579,18 @@ class LaTeXGenerator:
         return '\n'.join(lines)
     
     def _has_multirow(self) -> bool:
-        for row in range(self.table_model.rows):
-            for col in range(self.table_model.cols):
-                cell = self.table_model.get_cell(row, col)
-                if cell and cell.span.row_span > 1:
-                    return True
-        return False
+        version = self.table_model.version
+        if self._has_multirow_cache and self._has_multirow_cache[0] == version:
+            return self._has_multirow_cache[1]
+        
+        has_multirow = any(
+            cell and cell.span.row_span > 1
+            for row_cells in self._get_grid()
+            for cell in row_cells
+        )
+        
+        self._has_multirow_cache = (version, has_multirow)
+        return has_multirow
     
     def generate_with_caption(self, style: str = "tabular", 
                             caption: str = "", 
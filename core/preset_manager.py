@@ -1,14 +1,36 @@
 import json
 import os
-from typing import Dict, List, Optional
+import re
+from typing import Dict, List, Optional, Tuple
 from core.table_model import TableModel
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Top-level "name" field as written by save_preset (first key in the file)
+_NAME_FIELD_RE = re.compile(rb'("name"\s*:\s*)"(?:[^"\\]|\\.)*"')
+
+
+def _dumps_preset(preset_data: Dict) -> bytes:
+    """Serialize preset data as indented UTF-8 JSON, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(preset_data, option=orjson.OPT_INDENT_2)
+    return json.dumps(preset_data, indent=2, ensure_ascii=False).encode('utf-8')
+
 
 class PresetManager:
+    __slots__ = ('presets_dir', '_info_cache', '_sorted_cache')
+    
     def __init__(self, presets_dir: str = "presets"):
         self.presets_dir = Path(presets_dir)
         self.presets_dir.mkdir(exist_ok=True)
+        # Parsed preset metadata keyed by path, invalidated by file mtime
+        self._info_cache: Dict[Path, Tuple[int, Dict, Tuple]] = {}
+        # (per-file mtime signature, cache entries sorted newest first)
+        self._sorted_cache: Optional[Tuple[Tuple, List]] = None
     
     def save_preset(self, table_model: TableModel, name: str, 
                    description: str = "", tags: List[str] = None) -> bool:
@@ -30,8 +52,10 @@ class PresetManager:
         filepath = self.presets_dir / filename
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(preset_data, f, indent=2, ensure_ascii=False)
+            # Timestamps can be too coarse to tell two quick saves apart
+            self._info_cache.pop(filepath, None)
+            with open(filepath, 'wb') as f:
+                f.write(_dumps_preset(preset_data))
             return True
         except Exception as e:
             print(f"Failed to save preset: {e}")
@@ -55,42 +79,88 @@ class PresetManager:
             return None
     
     def get_preset_info(self, name: str) -> Optional[Dict]:
-        filename = f"{name}.json"
-        filepath = self.presets_dir / filename
+        filepath = self.presets_dir / f"{name}.json"
+        entry = self._get_cache_entry(filepath, name)
+        return dict(entry[1]) if entry else None
+    
+    def _get_cache_entry(self, filepath: Path, name: str,
+                         stat: os.stat_result = None) -> Optional[Tuple[int, Dict, Tuple]]:
+        """Return (mtime_ns, info, search_keys) for a preset file, parsing it only when changed"""
+        if stat is None:
+            try:
+                stat = filepath.stat()
+            except FileNotFoundError:
+                self._info_cache.pop(filepath, None)
+                return None
+            except Exception as e:
+                print(f"Failed to get preset info: {e}")
+                return None
         
-        if not filepath.exists():
-            return None
+        cached = self._info_cache.get(filepath)
+        if cached and cached[0] == stat.st_mtime_ns:
+            return cached
         
         try:
             with open(filepath, 'r', encoding='utf-8') as f:
                 preset_data = json.load(f)
             
-            return {
+            info = {
                 'name': preset_data.get('name', name),
                 'description': preset_data.get('description', ''),
                 'tags': preset_data.get('tags', []),
                 'version': preset_data.get('version', '1.0'),
                 'file_path': str(filepath),
-                'file_size': filepath.stat().st_size,
-                'modified_time': filepath.stat().st_mtime
+                'file_size': stat.st_size,
+                'modified_time': stat.st_mtime
             }
+            # Lowercased name, description and tags for case-insensitive search
+            search_keys = (
+                str(info['name']).lower(),
+                str(info['description']).lower(),
+                tuple(str(tag).lower() for tag in info['tags'])
+            )
+            entry = (stat.st_mtime_ns, info, search_keys)
+            self._info_cache[filepath] = entry
+            return entry
         except Exception as e:
             print(f"Failed to get preset info: {e}")
             return None
     
     def list_presets(self) -> List[Dict]:
-        presets = []
+        return [dict(entry[1]) for entry in self._list_cached()]
+    
+    def _list_cached(self) -> List[Tuple[int, Dict, Tuple]]:
+        """Collect cache entries for all presets, newest first, reusing cached metadata where unchanged"""
+        entries = []
         
         try:
-            for filepath in self.presets_dir.glob("*.json"):
-                name = filepath.stem
-                preset_info = self.get_preset_info(name)
-                if preset_info:
-                    presets.append(preset_info)
+            # scandir yields the stat data with each entry, so unchanged presets cost no extra syscalls
+            with os.scandir(self.presets_dir) as it:
+                for dir_entry in it:
+                    if not dir_entry.name.endswith('.json') or not dir_entry.is_file():
+                        continue
+                    filepath = self.presets_dir / dir_entry.name
+                    entry = self._get_cache_entry(filepath, filepath.stem, dir_entry.stat())
+                    if entry:
+                        entries.append((filepath, entry))
         except Exception as e:
             print(f"Failed to list presets: {e}")
         
-        return sorted(presets, key=lambda x: x.get('modified_time', 0), reverse=True)
+        # Reuse the previous ordering while no preset was added, removed or modified
+        signature = tuple((filepath, entry[0]) for filepath, entry in entries)
+        if self._sorted_cache and self._sorted_cache[0] == signature:
+            return self._sorted_cache[1]
+        
+        presets = sorted((entry for _, entry in entries),
+                         key=lambda entry: entry[1].get('modified_time', 0), reverse=True)
+        self._sorted_cache = (signature, presets)
+        return presets
+    
+    def refresh(self):
+        """Drop cached metadata for preset files that no longer exist"""
+        for filepath in [path for path in self._info_cache if not path.exists()]:
+            del self._info_cache[filepath]
+        self._sorted_cache = None
     
     def delete_preset(self, name: str) -> bool:
         filename = f"{name}.json"
@@ -101,6 +171,7 @@ class PresetManager:
         
         try:
             filepath.unlink()
+            self._info_cache.pop(filepath, None)
             return True
         except Exception as e:
             print(f"Failed to delete preset: {e}")
@@ -117,15 +188,28 @@ class PresetManager:
             return False
         
         try:
-            with open(old_filepath, 'r', encoding='utf-8') as f:
-                preset_data = json.load(f)
+            content = old_filepath.read_bytes()
             
-            preset_data['name'] = new_name
+            # Patch the name field in place rather than re-serializing the whole preset
+            name_literal = json.dumps(new_name, ensure_ascii=False).encode('utf-8')
+            content, count = _NAME_FIELD_RE.subn(lambda m: m.group(1) + name_literal, content, count=1)
+            if not count:
+                preset_data = json.loads(content)
+                preset_data['name'] = new_name
+                content = _dumps_preset(preset_data)
             
-            with open(new_filepath, 'w', encoding='utf-8') as f:
-                json.dump(preset_data, f, indent=2, ensure_ascii=False)
+            # Write the patched copy beside the presets and move it into place before removing
+            # the original, so a failure at any point leaves the original intact
+            temp_filepath = self.presets_dir / f"{new_name}.json.tmp"
+            try:
+                temp_filepath.write_bytes(content)
+                os.replace(temp_filepath, new_filepath)
+            except Exception:
+                temp_filepath.unlink(missing_ok=True)
+                raise
             
             old_filepath.unlink()
+            self._info_cache.pop(old_filepath, None)
             return True
         except Exception as e:
             print(f"Failed to rename preset: {e}")
@@ -167,8 +251,9 @@ class PresetManager:
             
             filepath = self.presets_dir / filename
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(preset_data, f, indent=2, ensure_ascii=False)
+            self._info_cache.pop(filepath, None)
+            with open(filepath, 'wb') as f:
+                f.write(_dumps_preset(preset_data))
             
             return True
         except Exception as e:
@@ -180,36 +265,30 @@ class PresetManager:
         query = query.lower()
         results = []
         
-        for preset in self.list_presets():
+        for _, preset, (name_lc, description_lc, tags_lc) in self._list_cached():
             match = False
             
-            if query in preset['name'].lower():
+            if query in name_lc:
                 match = True
             
-            if search_description and query in preset.get('description', '').lower():
+            if search_description and query in description_lc:
                 match = True
             
             if search_tags:
-                for tag in preset.get('tags', []):
-                    if query in tag.lower():
+                for tag in tags_lc:
+                    if query in tag:
                         match = True
                         break
             
             if match:
-                results.append(preset)
+                results.append(dict(preset))
         
         return results
     
     def get_presets_by_tag(self, tag: str) -> List[Dict]:
         tag = tag.lower()
-        results = []
-        
-        for preset in self.list_presets():
-            preset_tags = [t.lower() for t in preset.get('tags', [])]
-            if tag in preset_tags:
-                results.append(preset)
-        
-        return results
+        return [dict(preset) for _, preset, (_, _, tags_lc) in self._list_cached()
+                if tag in tags_lc]
     
     def _is_valid_filename(self, name: str) -> bool:
         if not name or len(name.strip()) == 0:
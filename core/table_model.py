@@ -1,151 +1,331 @@
+import re
+import sys
 from typing import Dict, Tuple, Any, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class CellSpan:
     row_span: int = 1
     col_span: int = 1
 
 
-@dataclass
+# Span shared by every unmerged cell; merging assigns a fresh CellSpan, never mutate this one
+_DEFAULT_SPAN = CellSpan()
+
+
+# Cell.flags bits
+BOLD = 1 << 0
+ITALIC = 1 << 1
+MERGED = 1 << 2
+HEADER = 1 << 3
+SPANNED = 1 << 4  # span covers more than one row or column
+
+# Canonical alignment strings, shared by every cell
+_ALIGNMENTS = {value: sys.intern(value) for value in ('l', 'c', 'r')}
+
+# font_style -> (canonical string, BOLD/ITALIC bits it implies)
+_FONT_STYLES = {
+    style: (sys.intern(style), style_flags)
+    for style, style_flags in (('normal', 0), ('bold', BOLD), ('italic', ITALIC), ('roman', 0))
+}
+
+# One comma-separated range spec item: a number, a "start-end" range, or anything else (ignored)
+_RANGE_ITEM_RE = re.compile(r'\s*(?:(\d+)\s*(?:-\s*(\d+))?\s*(?=,|\Z)|[^,]*)(?:,|\Z)')
+# Largest index parse_range_spec marks in a sieve; a sieve grows with the largest index, not the spec
+_SIEVE_MAX_INDEX = 4096
+
+
+def _flag_property(bit: int) -> property:
+    """Expose a single Cell.flags bit as a boolean attribute"""
+    def getter(cell) -> bool:
+        return bool(cell.flags & bit)
+    
+    def setter(cell, value: bool):
+        cell.flags = cell.flags | bit if value else cell.flags & ~bit
+    
+    return property(getter, setter)
+
+
+@dataclass(slots=True)
 class Cell:
     content: str = ""
-    span: CellSpan = None
-    is_merged_part: bool = False
+    span: CellSpan = field(default_factory=lambda: _DEFAULT_SPAN)
     alignment: str = "l"  # l, c, r for left, center, right
-    is_bold: bool = False  # Independent font formatting
-    is_italic: bool = False  # Independent font formatting
     font_style: str = ""  # empty = use defaults, "normal", "bold", "italic"
-    is_header: bool = False  # Deprecated - will be replaced by explicit header ranges
+    flags: int = 0  # BOLD, ITALIC, MERGED, HEADER and SPANNED bits
     
-    def __post_init__(self):
-        if self.span is None:
-            self.span = CellSpan()
+    is_merged_part = _flag_property(MERGED)
+    is_bold = _flag_property(BOLD)  # Independent font formatting
+    is_italic = _flag_property(ITALIC)  # Independent font formatting
+    is_header = _flag_property(HEADER)  # Deprecated - will be replaced by explicit header ranges
+
+
+# Shared stand-ins for cells that were never modified; never mutate these
+_DEFAULT_CELL = Cell(alignment="c")  # New cells default to center alignment
+_CLEARED_CELL = Cell()  # clear() resets every cell to left alignment
 
 
 class TableModel:
     def __init__(self, rows: int = 5, cols: int = 5):
         self.rows = rows
         self.cols = cols
-        self._cells: Dict[Tuple[int, int], Cell] = {}
+        # Sparse, keyed by row * cols + col: only cells that were written to are stored
+        self._cells: Dict[int, Cell] = {}
+        # Returned by get_cell for positions without a stored cell
+        self._blank_cell: Cell = _DEFAULT_CELL
         self._merged_regions: list = []
+        # (row, col) -> first merged region covering it, for get_merge_info
+        self._merge_index: Dict[Tuple[int, int], Tuple[int, int, int, int]] = {}
+        # Incremented on every mutation so derived data can be cached per version
+        self.version: int = 0
+        # (version, result) of the last to_dict() call
+        self._dict_cache: Optional[Tuple[int, dict]] = None
         
         # New explicit header specifications (1-based as per user input)
         self.header_rows_spec: str = ""  # e.g., "1", "1,2", "1-3"
         self.header_cols_spec: str = ""  # e.g., "1", "1,2", "1-3"
-        
-        for i in range(rows):
-            for j in range(cols):
-                cell = Cell()
-                cell.alignment = "c"  # Default to center alignment
-                self._cells[(i, j)] = cell
+        # (spec, parsed 0-based indices) so each spec is parsed once per change
+        self._header_rows_cache: Tuple[str, frozenset] = ("", frozenset())
+        self._header_cols_cache: Tuple[str, frozenset] = ("", frozenset())
+        # ((rows spec, cols spec, rows, cols), mask) for header_mask()
+        self._header_mask_cache: Optional[Tuple[tuple, Tuple[Tuple[bool, ...], ...]]] = None
     
     def get_cell(self, row: int, col: int) -> Optional[Cell]:
+        """Get the cell at a position for reading; use the setters to modify it"""
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            return self._cells.get(row * self.cols + col, self._blank_cell)
+        return None
+    
+    def _ensure_cell(self, row: int, col: int) -> Optional[Cell]:
+        """Get a writable cell, storing a copy of the blank cell on first write"""
         if 0 <= row < self.rows and 0 <= col < self.cols:
-            return self._cells.get((row, col))
+            key = row * self.cols + col
+            cell = self._cells.get(key)
+            if cell is None:
+                cell = self._cells[key] = Cell(alignment=self._blank_cell.alignment)
+            return cell
         return None
     
     def set_cell_content(self, row: int, col: int, content: str):
-        cell = self.get_cell(row, col)
+        cell = self._ensure_cell(row, col)
         if cell and not cell.is_merged_part:
             cell.content = content
+            self.version += 1
     
     def set_cell_alignment(self, row: int, col: int, alignment: str):
-        cell = self.get_cell(row, col)
-        if cell and alignment in ['l', 'c', 'r']:
+        alignment = _ALIGNMENTS.get(alignment)
+        cell = alignment and self._ensure_cell(row, col)
+        if cell:
             cell.alignment = alignment
+            self.version += 1
     
     def set_cell_bold(self, row: int, col: int, is_bold: bool):
-        cell = self.get_cell(row, col)
+        cell = self._ensure_cell(row, col)
         if cell:
             cell.is_bold = is_bold
+            self.version += 1
     
     def set_cell_italic(self, row: int, col: int, is_italic: bool):
-        cell = self.get_cell(row, col)
+        cell = self._ensure_cell(row, col)
         if cell:
             cell.is_italic = is_italic
+            self.version += 1
     
     def set_cell_font_style(self, row: int, col: int, font_style: str):
         """Set font style: normal, bold, italic, roman"""
-        cell = self.get_cell(row, col)
-        if cell and font_style in ['normal', 'bold', 'italic', 'roman']:
-            cell.font_style = font_style
+        entry = _FONT_STYLES.get(font_style)
+        cell = entry and self._ensure_cell(row, col)
+        if cell:
+            cell.font_style, style_flags = entry
             # Update individual flags for backward compatibility
-            cell.is_bold = (font_style == 'bold')
-            cell.is_italic = (font_style == 'italic')
+            cell.flags = (cell.flags & ~(BOLD | ITALIC)) | style_flags
+            self.version += 1
     
     def reset_cell_formatting(self, row: int, col: int):
         """Reset cell formatting to use defaults"""
-        cell = self.get_cell(row, col)
+        cell = self._ensure_cell(row, col)
         if cell:
-            cell.is_bold = False
-            cell.is_italic = False
+            cell.flags &= ~(BOLD | ITALIC)
             cell.font_style = ""  # Empty = use defaults
+            self.version += 1
+    
+    def _iter_range_cells(self, ranges: list):
+        """Yield a writable cell for every in-bounds position of (start_row, start_col, end_row, end_col) ranges"""
+        ensure_cell = self._ensure_cell
+        if len(ranges) == 1:
+            start_row, start_col, end_row, end_col = ranges[0]
+            for row in range(start_row, end_row + 1):
+                for col in range(start_col, end_col + 1):
+                    cell = ensure_cell(row, col)
+                    if cell:
+                        yield cell
+            return
+        
+        # Flatten to unique positions so cells shared by overlapping ranges are visited once
+        positions = {(row, col)
+                     for start_row, start_col, end_row, end_col in ranges
+                     for row in range(start_row, end_row + 1)
+                     for col in range(start_col, end_col + 1)}
+        for row, col in positions:
+            cell = ensure_cell(row, col)
+            if cell:
+                yield cell
+    
+    def set_range_alignment(self, ranges: list, alignment: str):
+        """Set the alignment of every cell in the given ranges"""
+        alignment = _ALIGNMENTS.get(alignment)
+        if alignment:
+            for cell in self._iter_range_cells(ranges):
+                cell.alignment = alignment
+            self.version += 1
+    
+    def set_range_font_style(self, ranges: list, font_style: str):
+        """Set the font style of every cell in the given ranges"""
+        entry = _FONT_STYLES.get(font_style)
+        if entry:
+            font_style, style_flags = entry
+            for cell in self._iter_range_cells(ranges):
+                cell.font_style = font_style
+                cell.flags = (cell.flags & ~(BOLD | ITALIC)) | style_flags
+            self.version += 1
+    
+    def reset_range_formatting(self, ranges: list):
+        """Reset the formatting of every cell in the given ranges to use defaults"""
+        for cell in self._iter_range_cells(ranges):
+            cell.flags &= ~(BOLD | ITALIC)
+            cell.font_style = ""
+        self.version += 1
+    
+    def get_range_font_states(self, ranges: list) -> Tuple[bool, bool, bool]:
+        """Get (any bold, any italic, any explicitly normal) over the cells in the given ranges"""
+        has_bold = has_italic = has_normal = False
+        cells = self._cells
+        cols = self.cols
+        for start_row, start_col, end_row, end_col in ranges:
+            # Only stored cells can carry formatting, so visit whichever set is smaller
+            start_row, start_col = max(start_row, 0), max(start_col, 0)
+            end_row, end_col = min(end_row, self.rows - 1), min(end_col, cols - 1)
+            if (end_row - start_row + 1) * (end_col - start_col + 1) <= len(cells):
+                candidates = (cells.get(row * cols + col)
+                              for row in range(start_row, end_row + 1)
+                              for col in range(start_col, end_col + 1))
+            else:
+                candidates = (cell for key, cell in cells.items()
+                              if start_row <= key // cols <= end_row
+                              and start_col <= key % cols <= end_col)
+            for cell in candidates:
+                if cell is None:
+                    continue
+                flags = cell.flags
+                if flags & BOLD:
+                    has_bold = True
+                if flags & ITALIC:
+                    has_italic = True
+                if cell.font_style == "normal":
+                    has_normal = True
+                if has_bold and has_italic and has_normal:
+                    return True, True, True
+        return has_bold, has_italic, has_normal
     
     def set_row_as_header(self, row: int, is_header: bool = True):
         """Mark an entire row as header (DEPRECATED - use header_rows_spec instead)"""
+        self._mark_row_header(row, is_header)
+        self.version += 1
+    
+    def set_column_as_header(self, col: int, is_header: bool = True):
+        """Mark an entire column as header (DEPRECATED - use header_cols_spec instead)"""
+        self._mark_column_header(col, is_header)
+        self.version += 1
+    
+    def _mark_row_header(self, row: int, is_header: bool):
         for col in range(self.cols):
-            cell = self.get_cell(row, col)
+            cell = self._ensure_cell(row, col)
             if cell:
                 cell.is_header = is_header
                 # No longer automatically sets bold formatting
     
-    def set_column_as_header(self, col: int, is_header: bool = True):
-        """Mark an entire column as header (DEPRECATED - use header_cols_spec instead)"""
+    def _mark_column_header(self, col: int, is_header: bool):
         for row in range(self.rows):
-            cell = self.get_cell(row, col)
+            cell = self._ensure_cell(row, col)
             if cell:
                 cell.is_header = is_header
                 # No longer automatically sets bold formatting
     
+    def _row_has_header(self, row: int) -> bool:
+        # Blank cells are never headers, so only stored cells in the row's key range matter
+        cells = self._cells
+        cols = self.cols
+        return 0 <= row < self.rows and any(
+            (cell := cells.get(key)) is not None and cell.flags & HEADER
+            for key in range(row * cols, (row + 1) * cols)
+        )
+    
+    def _column_has_header(self, col: int) -> bool:
+        # Same as _row_has_header, over the column's strided key range
+        cells = self._cells
+        cols = self.cols
+        return 0 <= col < cols and any(
+            (cell := cells.get(key)) is not None and cell.flags & HEADER
+            for key in range(col, self.rows * cols, cols)
+        )
+    
     def toggle_row_header(self, row: int):
         """Toggle header status for an entire row"""
-        # Check if any cell in the row is currently a header
-        is_currently_header = any(
-            self.get_cell(row, col) and self.get_cell(row, col).is_header 
-            for col in range(self.cols)
-        )
-        # Toggle to opposite state
-        self.set_row_as_header(row, not is_currently_header)
-        return not is_currently_header
+        return self.toggle_row_headers([row])[0]
     
     def toggle_column_header(self, col: int):
         """Toggle header status for an entire column"""
-        # Check if any cell in the column is currently a header
-        is_currently_header = any(
-            self.get_cell(row, col) and self.get_cell(row, col).is_header 
-            for row in range(self.rows)
-        )
-        # Toggle to opposite state
-        self.set_column_as_header(col, not is_currently_header)
-        return not is_currently_header
+        return self.toggle_column_headers([col])[0]
+    
+    def toggle_row_headers(self, rows: list) -> list:
+        """Toggle header status for several rows as one change; returns each row's new state"""
+        states = []
+        for row in rows:
+            # Toggle to opposite state
+            is_header = not self._row_has_header(row)
+            self._mark_row_header(row, is_header)
+            states.append(is_header)
+        self.version += 1
+        return states
+    
+    def toggle_column_headers(self, cols: list) -> list:
+        """Toggle header status for several columns as one change; returns each column's new state"""
+        states = []
+        for col in cols:
+            # Toggle to opposite state
+            is_header = not self._column_has_header(col)
+            self._mark_column_header(col, is_header)
+            states.append(is_header)
+        self.version += 1
+        return states
     
     def set_cells_as_header(self, cells: list, is_header: bool = True):
         """Mark a list of (row, col) cells as headers (DEPRECATED)"""
         for row, col in cells:
-            cell = self.get_cell(row, col)
+            cell = self._ensure_cell(row, col)
             if cell:
                 cell.is_header = is_header
                 # No longer automatically sets bold formatting
+        self.version += 1
     
     def clear_all_headers(self):
         """Remove header formatting from all cells in the table"""
-        for row in range(self.rows):
-            for col in range(self.cols):
-                cell = self.get_cell(row, col)
-                if cell:
-                    cell.is_header = False
-                    # Bold formatting is now independent
+        for cell in self._cells.values():
+            cell.is_header = False
+            # Bold formatting is now independent
+        self.version += 1
     
     # NEW: Header range specification methods
     def set_header_rows_spec(self, spec: str):
         """Set header rows specification (1-based, e.g., '1', '1,2', '1-3')"""
         self.header_rows_spec = spec.strip()
+        self.version += 1
     
     def set_header_cols_spec(self, spec: str):
         """Set header columns specification (1-based, e.g., '1', '1,2', '1-3')"""
         self.header_cols_spec = spec.strip()
+        self.version += 1
     
     def parse_range_spec(self, spec: str) -> list:
         """Parse a range specification string into a list of 0-based indices
@@ -158,56 +338,92 @@ class TableModel:
         - '1,' -> [0]
         - '' -> []
         """
-        if not spec.strip():
-            return []
+        ranges = []
+        highest = -1
+        for match in _RANGE_ITEM_RE.finditer(spec):
+            start, end = match.groups()
+            if start is None:
+                # Empty or invalid item, skip
+                continue
+            start_idx = int(start) - 1  # Convert to 0-based
+            end_idx = start_idx if end is None else int(end) - 1
+            if 0 <= start_idx <= end_idx:
+                ranges.append((start_idx, end_idx))
+                if end_idx > highest:
+                    highest = end_idx
         
-        indices = []
-        parts = [part.strip() for part in spec.split(',') if part.strip()]
+        # Mark indices in a sieve, which removes duplicates and sorts in one pass
+        if highest < 64:
+            seen = 0
+            for start_idx, end_idx in ranges:
+                seen |= ((2 << (end_idx - start_idx)) - 1) << start_idx
+            return [i for i in range(highest + 1) if seen >> i & 1]
         
-        for part in parts:
-            if '-' in part:
-                # Range specification
-                try:
-                    start, end = part.split('-', 1)
-                    start_idx = int(start.strip()) - 1  # Convert to 0-based
-                    end_idx = int(end.strip()) - 1      # Convert to 0-based
-                    if start_idx >= 0 and end_idx >= start_idx:
-                        indices.extend(range(start_idx, end_idx + 1))
-                except ValueError:
-                    # Invalid range, skip
-                    continue
-            else:
-                # Single value
-                try:
-                    idx = int(part.strip()) - 1  # Convert to 0-based
-                    if idx >= 0:
-                        indices.append(idx)
-                except ValueError:
-                    # Invalid number, skip
-                    continue
+        if highest <= _SIEVE_MAX_INDEX:
+            sieve = bytearray(highest + 1)
+            for start_idx, end_idx in ranges:
+                sieve[start_idx:end_idx + 1] = b'\x01' * (end_idx - start_idx + 1)
+            return [i for i, marked in enumerate(sieve) if marked]
         
         # Remove duplicates and sort
-        return sorted(list(set(indices)))
+        indices = set()
+        for start_idx, end_idx in ranges:
+            indices.update(range(start_idx, end_idx + 1))
+        return sorted(indices)
+    
+    def _get_header_row_set(self) -> frozenset:
+        """Parsed header rows, re-parsed only when the specification changes"""
+        spec, indices = self._header_rows_cache
+        if spec != self.header_rows_spec:
+            spec = self.header_rows_spec
+            indices = frozenset(self.parse_range_spec(spec))
+            self._header_rows_cache = (spec, indices)
+        return indices
+    
+    def _get_header_col_set(self) -> frozenset:
+        """Parsed header columns, re-parsed only when the specification changes"""
+        spec, indices = self._header_cols_cache
+        if spec != self.header_cols_spec:
+            spec = self.header_cols_spec
+            indices = frozenset(self.parse_range_spec(spec))
+            self._header_cols_cache = (spec, indices)
+        return indices
     
     def get_header_rows(self) -> list:
         """Get list of 0-based header row indices from specification"""
-        return self.parse_range_spec(self.header_rows_spec)
+        return sorted(self._get_header_row_set())
     
     def get_header_cols(self) -> list:
         """Get list of 0-based header column indices from specification"""
-        return self.parse_range_spec(self.header_cols_spec)
+        return sorted(self._get_header_col_set())
     
     def is_header_row(self, row: int) -> bool:
         """Check if a row is a header row based on explicit specification"""
-        return row in self.get_header_rows()
+        return row in self._get_header_row_set()
     
     def is_header_col(self, col: int) -> bool:
         """Check if a column is a header column based on explicit specification"""
-        return col in self.get_header_cols()
+        return col in self._get_header_col_set()
     
     def is_header_cell(self, row: int, col: int) -> bool:
         """Check if a cell is in header area based on explicit specification"""
-        return self.is_header_row(row) or self.is_header_col(col)
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            return self.header_mask()[row][col]
+        return row in self._get_header_row_set() or col in self._get_header_col_set()
+    
+    def header_mask(self) -> Tuple[Tuple[bool, ...], ...]:
+        """Row-major is_header_cell() results for the whole table, cached until the specs or size change"""
+        key = (self.header_rows_spec, self.header_cols_spec, self.rows, self.cols)
+        if self._header_mask_cache and self._header_mask_cache[0] == key:
+            return self._header_mask_cache[1]
+        
+        header_cols = self._get_header_col_set()
+        all_header = (True,) * self.cols
+        data_row = tuple(col in header_cols for col in range(self.cols))
+        header_rows = self._get_header_row_set()
+        mask = tuple(all_header if row in header_rows else data_row for row in range(self.rows))
+        self._header_mask_cache = (key, mask)
+        return mask
     
     def merge_cells(self, start_row: int, start_col: int, end_row: int, end_col: int):
         if not (0 <= start_row <= end_row < self.rows and 
@@ -217,7 +433,7 @@ class TableModel:
         if start_row == end_row and start_col == end_col:
             return False
         
-        main_cell = self.get_cell(start_row, start_col)
+        main_cell = self._ensure_cell(start_row, start_col)
         if not main_cell:
             return False
         
@@ -225,17 +441,21 @@ class TableModel:
         col_span = end_col - start_col + 1
         
         main_cell.span = CellSpan(row_span, col_span)
+        main_cell.flags |= SPANNED
         
+        ensure_cell = self._ensure_cell
         for i in range(start_row, end_row + 1):
-            for j in range(start_col, end_col + 1):
-                if i == start_row and j == start_col:
-                    continue
-                cell = self.get_cell(i, j)
-                if cell:
-                    cell.is_merged_part = True
-                    cell.content = ""
+            # The main cell keeps its content and flags
+            first_col = start_col + 1 if i == start_row else start_col
+            for j in range(first_col, end_col + 1):
+                cell = ensure_cell(i, j)
+                cell.flags |= MERGED
+                cell.content = ""
         
-        self._merged_regions.append((start_row, start_col, end_row, end_col))
+        region = (start_row, start_col, end_row, end_col)
+        self._merged_regions.append(region)
+        self._index_merge_region(region)
+        self.version += 1
         return True
     
     def unmerge_cells(self, row: int, col: int):
@@ -246,97 +466,149 @@ class TableModel:
         end_row = row + cell.span.row_span - 1
         end_col = col + cell.span.col_span - 1
         
-        for i in range(row, end_row + 1):
-            for j in range(col, end_col + 1):
-                target_cell = self.get_cell(i, j)
+        # Blank cells are never merged, only stored cells need resetting
+        cells = self._cells
+        cols = self.cols
+        # Spans can reach past the edge after a resize
+        for i in range(row, min(end_row, self.rows - 1) + 1):
+            for j in range(col, min(end_col, cols - 1) + 1):
+                target_cell = cells.get(i * cols + j)
                 if target_cell:
-                    target_cell.is_merged_part = False
-                    target_cell.span = CellSpan()
+                    target_cell.flags &= ~(MERGED | SPANNED)
+                    target_cell.span = _DEFAULT_SPAN
         
         self._merged_regions = [region for region in self._merged_regions 
                                if region != (row, col, end_row, end_col)]
+        self._rebuild_merge_index()
+        self.version += 1
         return True
     
     def is_cell_merged(self, row: int, col: int) -> bool:
         cell = self.get_cell(row, col)
-        return cell and (cell.is_merged_part or 
-                        cell.span.row_span > 1 or cell.span.col_span > 1)
+        return cell and bool(cell.flags & (MERGED | SPANNED))
     
     def get_merge_info(self, row: int, col: int) -> Optional[Tuple[int, int, int, int]]:
+        return self._merge_index.get((row, col))
+    
+    def _index_merge_region(self, region):
+        """Add a region to the merge index; earlier regions keep the positions they cover"""
+        start_row, start_col, end_row, end_col = region
+        setdefault = self._merge_index.setdefault
+        for i in range(start_row, end_row + 1):
+            for j in range(start_col, end_col + 1):
+                setdefault((i, j), region)
+    
+    def _rebuild_merge_index(self):
+        """Rebuild the merge index after regions were removed or replaced"""
+        self._merge_index = {}
         for region in self._merged_regions:
-            start_row, start_col, end_row, end_col = region
-            if start_row <= row <= end_row and start_col <= col <= end_col:
-                return region
-        return None
+            self._index_merge_region(region)
     
     def resize(self, new_rows: int, new_cols: int):
         if new_rows <= 0 or new_cols <= 0:
             return False
         
-        new_cells = {}
+        rows, cols = self.rows, self.cols
+        cells = self._cells
+        if new_cols == cols:
+            # Keys stay valid; only drop the rows past the new end
+            if new_rows < rows:
+                limit = new_rows * cols
+                for key in [key for key in cells if key >= limit]:
+                    del cells[key]
+        else:
+            # Keys depend on the column count, so re-key the cells that are kept
+            new_cells = {}
+            for key, cell in cells.items():
+                i, j = divmod(key, cols)
+                if i < new_rows and j < new_cols:
+                    new_cells[i * new_cols + j] = cell
+            self._cells = cells = new_cells
         
-        for i in range(new_rows):
-            for j in range(new_cols):
-                if i < self.rows and j < self.cols:
-                    new_cells[(i, j)] = self._cells.get((i, j), Cell())
-                else:
-                    cell = Cell()
-                    cell.alignment = "c"  # Default to center alignment
-                    new_cells[(i, j)] = cell
+        if self._blank_cell is not _DEFAULT_CELL:
+            # Added cells default to center alignment even after clear()
+            for i in range(new_rows):
+                first_new_col = 0 if i >= rows else cols
+                for j in range(first_new_col, new_cols):
+                    cells[i * new_cols + j] = Cell(alignment="c")
         
-        self._cells = new_cells
         self.rows = new_rows
         self.cols = new_cols
         
-        self._merged_regions = [
+        kept_regions = [
             region for region in self._merged_regions 
             if region[2] < new_rows and region[3] < new_cols
         ]
+        if len(kept_regions) != len(self._merged_regions):
+            self._merged_regions = kept_regions
+            self._rebuild_merge_index()
+        self.version += 1
         
         return True
     
     def clear(self):
         for cell in self._cells.values():
             cell.content = ""
-            cell.span = CellSpan()
-            cell.is_merged_part = False
+            cell.span = _DEFAULT_SPAN
+            cell.flags &= ~(MERGED | SPANNED)
             cell.alignment = "l"
+        self._blank_cell = _CLEARED_CELL
         self._merged_regions.clear()
+        self._merge_index.clear()
+        self.version += 1
     
     def to_dict(self) -> dict:
-        return {
+        """Serialize the table; the result is shared until the next change, so don't modify it"""
+        version = self.version
+        if self._dict_cache and self._dict_cache[0] == version:
+            return self._dict_cache[1]
+        
+        cols = self.cols
+        data = {
             'rows': self.rows,
-            'cols': self.cols,
+            'cols': cols,
             'cells': {
-                f"{row},{col}": {
+                "%d,%d" % divmod(key, cols): {
                     'content': cell.content,
                     'alignment': cell.alignment,
                     'row_span': cell.span.row_span,
                     'col_span': cell.span.col_span,
                     'is_merged_part': cell.is_merged_part
                 }
-                for (row, col), cell in self._cells.items()
-                if cell.content or cell.is_merged_part or 
-                   cell.span.row_span > 1 or cell.span.col_span > 1
+                for key, cell in sorted(self._cells.items())
+                if cell.content or cell.flags & (MERGED | SPANNED)
             },
             'merged_regions': self._merged_regions
         }
+        self._dict_cache = (version, data)
+        return data
     
     @classmethod
     def from_dict(cls, data: dict) -> 'TableModel':
         model = cls(data['rows'], data['cols'])
         
+        rows, cols = model.rows, model.cols
+        cells = model._cells
         for pos_str, cell_data in data.get('cells', {}).items():
             row, col = map(int, pos_str.split(','))
-            cell = model.get_cell(row, col)
-            if cell:
-                cell.content = cell_data.get('content', '')
-                cell.alignment = cell_data.get('alignment', 'l')
-                cell.span = CellSpan(
-                    cell_data.get('row_span', 1),
-                    cell_data.get('col_span', 1)
-                )
-                cell.is_merged_part = cell_data.get('is_merged_part', False)
+            if not (0 <= row < rows and 0 <= col < cols):
+                continue
+            get = cell_data.get
+            row_span = get('row_span', 1)
+            col_span = get('col_span', 1)
+            flags = MERGED if get('is_merged_part', False) else 0
+            if row_span != 1 or col_span != 1:
+                span = CellSpan(row_span, col_span)
+                if row_span > 1 or col_span > 1:
+                    flags |= SPANNED
+            else:
+                span = _DEFAULT_SPAN
+            alignment = get('alignment', 'l')
+            # The model is new, so every stored cell is built from scratch
+            cells[row * cols + col] = Cell(get('content', ''), span,
+                                           _ALIGNMENTS.get(alignment, alignment), "", flags)
         
         model._merged_regions = data.get('merged_regions', [])
+        model._rebuild_merge_index()
+        model.version += 1
         return model
\ No newline at end of file
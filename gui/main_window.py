@@ -1,10 +1,312 @@
+import json
+import logging
+import os
+import re
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
 from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                                QMenuBar, QToolBar, QStatusBar, QSplitter, 
-                               QPushButton, QSpinBox, QLabel, QComboBox, QDialog, QLineEdit)
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QKeySequence, QAction
+                               QPushButton, QSpinBox, QLabel, QComboBox, QDialog, QLineEdit,
+                               QApplication, QMessageBox)
+from PySide6.QtCore import Qt, QTimer, QSignalBlocker
+from PySide6.QtGui import QKeySequence, QAction, QActionGroup, QPalette, QColor
 from gui.table_editor import TableEditor
 from core.table_model import TableModel
+from core.latex_generator import LaTeXGenerator
+from utils.clipboard import copy_to_clipboard as _copy_text, save_to_temp_file, get_clipboard_status
+from utils.imagemagick_detector import get_imagemagick_info
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+logger = logging.getLogger(__name__)
+
+
+# Header specification syntax: comma-separated numbers or "start-end" ranges, empty items allowed
+_HEADER_SPEC_RE = re.compile(r'\s*(?:\d+\s*(?:-\s*\d+\s*)?)?(?:,\s*(?:\d+\s*(?:-\s*\d+\s*)?)?)*')
+
+
+def _dumps_settings(settings: dict) -> bytes:
+    """Serialize settings as indented UTF-8 JSON, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(settings, option=orjson.OPT_INDENT_2)
+    return json.dumps(settings, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _loads_settings(data: bytes) -> dict:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+_tool_versions = {}  # exe -> version line, for successful probes only
+
+
+def _probe_tool(exe: str) -> Optional[str]:
+    """First line of `exe --version`; "" if it fails, None if it cannot be run.
+    Successful probes are remembered; failures (e.g. a cold-start timeout) are retried next time."""
+    version = _tool_versions.get(exe)
+    if version is not None:
+        return version
+    try:
+        result = subprocess.run([exe, '--version'], capture_output=True, text=True,
+                                errors='replace', timeout=5)
+    except Exception:
+        return None
+    if result.returncode != 0:
+        return ""
+    version = result.stdout.partition('\n')[0]
+    if version:
+        _tool_versions[exe] = version
+    return version
+
+
+# Static text for Help > Installation Guide and Help > About
+_INSTALL_GUIDE_TEXT = """LaTeX Table Builder - Installation Guide
+
+MINIMAL INSTALLATION (for preview only):
+Download size: ~150-200MB
+
+• Ubuntu/Debian: sudo apt-get install texlive-latex-base texlive-latex-recommended texlive-fonts-recommended imagemagick
+• Fedora: sudo dnf install texlive-latex ImageMagick  
+• Arch: sudo pacman -S texlive-core imagemagick
+• macOS: brew install --cask basictex && brew install imagemagick
+
+FULL INSTALLATION (for document creation):
+• Ubuntu/Debian: sudo apt-get install texlive-latex-base texlive-latex-extra texlive-fonts-recommended
+• Fedora: sudo dnf install texlive-latex texlive-latex-extra
+• macOS: brew install --cask mactex
+• Windows: Install MiKTeX or TeX Live
+
+CLIPBOARD SUPPORT (Linux only):
+• Install xclip: sudo apt-get install xclip
+• Or install xsel: sudo apt-get install xsel
+• Quick fix: ./fix_clipboard.sh
+
+QUICK SETUP:
+• LaTeX: ./install_minimal_latex.sh
+• Clipboard: ./fix_clipboard.sh
+
+What you get with minimal installation:
+✓ LaTeX table preview in the application
+✓ PDF generation for basic tables
+✓ All standard table packages (tabular, booktabs, etc.)
+
+You DON'T need the full LaTeX installation unless you plan to:
+• Create complete LaTeX documents outside this application
+• Use advanced LaTeX packages not related to tables
+
+After installation, restart the application to detect new tools."""
+
+_ABOUT_TEXT = """LaTeX Table Builder v0.1.0
+
+A cross-platform LaTeX table builder with modern GUI interface.
+
+Features:
+• Spreadsheet-like table editor with merged cell support
+• Multiple LaTeX formats (tabular, longtable, booktabs, array)
+• Live LaTeX preview
+• One-click clipboard export
+• Table preset save/load functionality
+
+Developed with Python and PySide6/Qt.
+
+For more information, see the README file."""
+
+# Alignment combo box text -> model alignment code
+_ALIGN_MAP = {"Left": "l", "Center": "c", "Right": "r"}
+
+# Theme colours, applied through the application palette by MainWindow.apply_theme
+_DARK_COLORS = {
+    QPalette.ColorRole.Window: "#2b2b2b",
+    QPalette.ColorRole.WindowText: "#ffffff",
+    QPalette.ColorRole.Base: "#404040",
+    QPalette.ColorRole.AlternateBase: "#3c3c3c",
+    QPalette.ColorRole.Text: "#ffffff",
+    QPalette.ColorRole.Button: "#404040",
+    QPalette.ColorRole.ButtonText: "#ffffff",
+    QPalette.ColorRole.Highlight: "#555555",
+    QPalette.ColorRole.HighlightedText: "#ffffff",
+    QPalette.ColorRole.ToolTipBase: "#3c3c3c",
+    QPalette.ColorRole.ToolTipText: "#ffffff",
+}
+
+_LIGHT_COLORS = {
+    QPalette.ColorRole.Window: "#ffffff",
+    QPalette.ColorRole.WindowText: "#000000",
+    QPalette.ColorRole.Base: "#ffffff",
+    QPalette.ColorRole.AlternateBase: "#f0f0f0",
+    QPalette.ColorRole.Text: "#000000",
+    QPalette.ColorRole.Button: "#ffffff",
+    QPalette.ColorRole.ButtonText: "#000000",
+    QPalette.ColorRole.Highlight: "#e0e0e0",
+    QPalette.ColorRole.HighlightedText: "#000000",
+    QPalette.ColorRole.ToolTipBase: "#ffffff",
+    QPalette.ColorRole.ToolTipText: "#000000",
+}
+
+
+def _make_palette(colors) -> QPalette:
+    palette = QPalette()
+    for role, color in colors.items():
+        palette.setColor(role, QColor(color))
+    return palette
+
+
+# Stylesheets for what the palette cannot express: chrome backgrounds, borders, padding and indicators
+_DARK_QSS = """
+QMenuBar {
+    background-color: #3c3c3c;
+    border-bottom: 1px solid #555555;
+}
+QMenuBar::item {
+    background-color: transparent;
+    padding: 4px 8px;
+}
+QMenuBar::item:selected {
+    background-color: #555555;
+}
+QMenu {
+    background-color: #3c3c3c;
+    border: 1px solid #555555;
+}
+QMenu::item:selected {
+    background-color: #555555;
+}
+QToolBar {
+    background-color: #3c3c3c;
+    border: 1px solid #555555;
+}
+QStatusBar {
+    background-color: #3c3c3c;
+    border-top: 1px solid #555555;
+}
+QPushButton {
+    background-color: #404040;
+    border: 1px solid #666666;
+    padding: 5px 10px;
+    border-radius: 3px;
+}
+QPushButton:hover {
+    background-color: #505050;
+}
+QPushButton:pressed {
+    background-color: #606060;
+}
+QSpinBox, QComboBox {
+    border: 1px solid #666666;
+    padding: 2px;
+}
+QSpinBox::up-button, QSpinBox::down-button {
+    background-color: #505050;
+    border: 1px solid #666666;
+}
+QComboBox::drop-down {
+    background-color: #505050;
+    border: 1px solid #666666;
+}
+QCheckBox {
+    spacing: 5px;
+}
+QCheckBox::indicator {
+    width: 18px;
+    height: 18px;
+    border: 2px solid #666666;
+    border-radius: 3px;
+    background-color: #404040;
+}
+QCheckBox::indicator:unchecked {
+    background-color: #404040;
+    border: 2px solid #666666;
+}
+QCheckBox::indicator:checked {
+    background-color: #4CAF50;
+    border: 2px solid #4CAF50;
+    image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iOSIgdmlld0JveD0iMCAwIDEyIDkiIGZpbGw9Im5vbmUiIHhtbG5zPSJodHRwOi8vd3d3LnczLm9yZy8yMDAwL3N2ZyI+CjxwYXRoIGQ9Ik0xMC42IDEuNEw0LjQgNy42TDEuNCA0LjYiIHN0cm9rZT0id2hpdGUiIHN0cm9rZS13aWR0aD0iMiIgc3Ryb2tlLWxpbmVjYXA9InJvdW5kIiBzdHJva2UtbGluZWpvaW49InJvdW5kIi8+Cjwvc3ZnPgo=);
+    image-position: center;
+}
+QCheckBox::indicator:hover {
+    border: 2px solid #777777;
+}
+QCheckBox::indicator:disabled {
+    background-color: #2b2b2b;
+    border: 2px solid #555555;
+}
+"""
+
+
+_LIGHT_QSS = """
+QMenuBar {
+    background-color: #f0f0f0;
+    border-bottom: 1px solid #cccccc;
+}
+QMenuBar::item:selected {
+    background-color: #e0e0e0;
+}
+QMenu {
+    border: 1px solid #cccccc;
+}
+QMenu::item:selected {
+    background-color: #e0e0e0;
+}
+QToolBar {
+    background-color: #f0f0f0;
+    border: 1px solid #cccccc;
+}
+QStatusBar {
+    background-color: #f0f0f0;
+    border-top: 1px solid #cccccc;
+}
+QPushButton {
+    background-color: #ffffff;
+    border: 1px solid #cccccc;
+    padding: 5px 10px;
+    border-radius: 3px;
+}
+QPushButton:hover {
+    background-color: #f0f0f0;
+}
+QPushButton:pressed {
+    background-color: #e0e0e0;
+}
+QSpinBox, QComboBox {
+    border: 1px solid #cccccc;
+    padding: 2px;
+}
+QCheckBox {
+    spacing: 5px;
+}
+QCheckBox::indicator {
+    width: 18px;
+    height: 18px;
+    border: 2px solid #cccccc;
+    border-radius: 3px;
+    background-color: #ffffff;
+}
+QCheckBox::indicator:unchecked {
+    background-color: #ffffff;
+    border: 2px solid #cccccc;
+}
+QCheckBox::indicator:checked {
+    background-color: #4CAF50;
+    border: 2px solid #4CAF50;
+    image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iOSIgdmlld0JveD0iMCAwIDEyIDkiIGZpbGw9Im5vbmUiIHhtbG5zPSJodHRwOi8vd3d3LnczLm9yZy8yMDAwL3N2ZyI+CjxwYXRoIGQ9Ik0xMC42IDEuNEw0LjQgNy42TDEuNCA0LjYiIHN0cm9rZT0id2hpdGUiIHN0cm9rZS13aWR0aD0iMiIgc3Ryb2tlLWxpbmVjYXA9InJvdW5kIiBzdHJva2UtbGluZWpvaW49InJvdW5kIi8+Cjwvc3ZnPgo=);
+    image-position: center;
+}
+QCheckBox::indicator:hover {
+    border: 2px solid #aaaaaa;
+}
+QCheckBox::indicator:disabled {
+    background-color: #f0f0f0;
+    border: 2px solid #dddddd;
+}
+"""
 
 
 class MainWindow(QMainWindow):
@@ -12,17 +314,68 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.table_model = TableModel()
         self.current_table_style = None  # Current style settings
+        # Reused for every preview and copy so its per-model caches survive between calls
+        self._generator = LaTeXGenerator(self.table_model)
+        
+        # Coalesces bursts of edits into a single preview regeneration
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(100)
+        self._preview_timer.timeout.connect(self._do_update_preview)
+        # Runs one table refresh and preview update per event-loop turn
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+        # ((model version, table style), generated LaTeX), and the LaTeX last sent to the preview
+        self._latex_cache = None
+        self._last_latex = None
+        self._startup_finished = False
+        # Work deferred while the window was hidden or minimized, done on the next show
+        self._refresh_pending = False
+        self._preview_dirty = False
+        # Theme whose palette and stylesheet are currently set (None before the first apply_theme)
+        self._applied_theme = None
+        self._dark_palette = _make_palette(_DARK_COLORS)
+        self._light_palette = _make_palette(_LIGHT_COLORS)
+        
+        # Static message boxes, built on first use by _show_cached_message
+        self._dialogs = {}
+        # Runs independent blocking probes and file writes side by side; created by _get_io_pool
+        self._io_pool = None
+        # Parsed settings.json, read once by _load_settings
+        self._settings_cache = None
+        # Status message waiting for the next flush; only the latest one is shown
+        self._pending_status = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(16)
+        self._status_timer.timeout.connect(self._flush_status)
+        # Writes the theme preference once toggling settles
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(250)
+        self._save_timer.timeout.connect(self._do_save_theme_preference)
+        # (rows spec, columns spec) last applied by on_header_spec_changed
+        self._last_header_specs = ("", "")
+        # Applies the header specifications once typing pauses
+        self._header_spec_timer = QTimer(self)
+        self._header_spec_timer.setSingleShot(True)
+        self._header_spec_timer.setInterval(250)
+        self._header_spec_timer.timeout.connect(self.on_header_spec_changed)
         
         # Load saved theme preference
         self.dark_theme = self.load_theme_preference()
         
+        # Apply initial theme before building the widgets, so they are polished
+        # once as they are created rather than re-polished as a finished tree
+        self.apply_theme()
+        
         self.setup_ui()
         self.setup_menus()
         self.setup_toolbar()
         self.setup_statusbar()
-        
-        # Apply initial theme
-        self.apply_theme()
+        self.table_editor.set_theme(self.dark_theme)
         
         # Initialize preview
         self.update_preview()
@@ -54,7 +407,8 @@ class MainWindow(QMainWindow):
         table_controls = self.create_table_controls()
         layout.addWidget(table_controls)
         
-        self.table_editor = TableEditor(self.table_model)
+        # Cells are filled in after the window is first shown, see _finish_startup
+        self.table_editor = TableEditor(self.table_model, populate=False)
         self.table_editor.cell_changed.connect(self.on_table_changed)
         self.table_editor.toggle_headers_requested.connect(self.toggle_headers)
         layout.addWidget(self.table_editor)
@@ -137,15 +491,62 @@ class MainWindow(QMainWindow):
         latex_controls = self.create_latex_controls()
         layout.addWidget(latex_controls)
         
-        from gui.preview_widget import PreviewWidget
-        self.preview_widget = PreviewWidget()
-        layout.addWidget(self.preview_widget)
+        # The preview widget is created once the window is shown, see _init_preview_widget
+        self.preview_widget = None
+        self._preview_layout = layout
+        self._preview_placeholder = QWidget()
+        layout.addWidget(self._preview_placeholder)
         
         export_controls = self.create_export_controls()
         layout.addWidget(export_controls)
         
         return widget
     
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._startup_finished:
+            self._startup_finished = True
+            # Let the window chrome paint first, then fill in the heavy widgets
+            QTimer.singleShot(0, self._finish_startup)
+        elif self._refresh_pending:
+            self._do_refresh()
+        elif self._preview_dirty:
+            self._do_update_preview()
+    
+    def closeEvent(self, event):
+        # Don't lose a theme change still waiting on the save timer
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self._do_save_theme_preference()
+        if self._io_pool is not None:
+            self._io_pool.shutdown(wait=False)
+            self._io_pool = None
+        super().closeEvent(event)
+    
+    def _get_io_pool(self) -> ThreadPoolExecutor:
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(max_workers=2)
+        return self._io_pool
+    
+    def _is_hidden(self) -> bool:
+        return not self.isVisible() or self.isMinimized()
+    
+    def _finish_startup(self):
+        self.table_editor.refresh_table()
+        self._init_preview_widget()
+    
+    def _init_preview_widget(self):
+        """Replace the placeholder with the real preview widget and render the first preview"""
+        if self.preview_widget is not None:
+            return
+        
+        from gui.preview_widget import PreviewWidget
+        self.preview_widget = PreviewWidget()
+        self._preview_layout.replaceWidget(self._preview_placeholder, self.preview_widget)
+        self._preview_placeholder.deleteLater()
+        self._preview_placeholder = None
+        self._do_update_preview()
+    
     def create_latex_controls(self):
         widget = QWidget()
         layout = QHBoxLayout(widget)
@@ -167,14 +568,16 @@ class MainWindow(QMainWindow):
         self.header_rows_input = QLineEdit()
         self.header_rows_input.setPlaceholderText("e.g., 1, 1-2, 1,3-5")
         self.header_rows_input.setToolTip("Specify header rows using 1-based indexing (e.g., '1', '1,2', '1-3', '1,3-5')")
-        self.header_rows_input.textChanged.connect(self.on_header_spec_changed)
+        self.header_rows_input.textChanged.connect(self._header_spec_timer.start)
+        self.header_rows_input.editingFinished.connect(self.on_header_spec_changed)
         layout.addWidget(self.header_rows_input)
         
         layout.addWidget(QLabel("Header Columns:"))
         self.header_cols_input = QLineEdit()
         self.header_cols_input.setPlaceholderText("e.g., 1, 1-2, 1,3-5")
         self.header_cols_input.setToolTip("Specify header columns using 1-based indexing (e.g., '1', '1,2', '1-3', '1,3-5')")
-        self.header_cols_input.textChanged.connect(self.on_header_spec_changed)
+        self.header_cols_input.textChanged.connect(self._header_spec_timer.start)
+        self.header_cols_input.editingFinished.connect(self.on_header_spec_changed)
         layout.addWidget(self.header_cols_input)
         
         clear_headers_btn = QPushButton("Clear Headers")
@@ -265,7 +668,6 @@ class MainWindow(QMainWindow):
         view_menu.addAction(light_theme_action)
         
         # Create theme action group for mutual exclusivity
-        from PySide6.QtGui import QActionGroup
         self.theme_group = QActionGroup(self)
         self.theme_group.addAction(self.dark_theme_action)
         self.theme_group.addAction(light_theme_action)
@@ -286,75 +688,115 @@ class MainWindow(QMainWindow):
         self.setStatusBar(self.statusbar)
         self.statusbar.showMessage("Ready")
     
+    def _set_status(self, message: str):
+        """Show a status message, repainting the status bar at most once per frame"""
+        self._pending_status = message
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+    
+    def _flush_status(self):
+        self.statusbar.showMessage(self._pending_status)
+    
     def resize_table(self):
         new_rows = self.rows_spinbox.value()
         new_cols = self.cols_spinbox.value()
         
         if self.table_model.resize(new_rows, new_cols):
-            self.table_editor.refresh_table()
-            self.update_preview()
-            self.statusbar.showMessage(f"Table resized to {new_rows}×{new_cols}")
+            self._schedule_refresh()
+            self._set_status(f"Table resized to {new_rows}×{new_cols}")
     
     def on_table_changed(self, row: int, col: int, content: str):
         """Called whenever a table cell is modified"""
         self.update_preview()
     
     def change_alignment(self, alignment_text):
-        alignment_map = {"Left": "l", "Center": "c", "Right": "r"}
-        alignment = alignment_map.get(alignment_text, "l")
+        alignment = _ALIGN_MAP.get(alignment_text, "l")
         
-        selected_ranges = self.table_editor.get_selected_ranges()
-        for start_row, start_col, end_row, end_col in selected_ranges:
-            for row in range(start_row, end_row + 1):
-                for col in range(start_col, end_col + 1):
-                    self.table_model.set_cell_alignment(row, col, alignment)
+        self.table_model.set_range_alignment(self.table_editor.get_selected_ranges(), alignment)
         
-        self.table_editor.refresh_table()
-        self.update_preview()
+        self._schedule_refresh()
     
     def merge_selected_cells(self):
         selected_ranges = self.table_editor.get_selected_ranges()
         if not selected_ranges:
-            self.statusbar.showMessage("No cells selected")
+            self._set_status("No cells selected")
             return
         
         start_row, start_col, end_row, end_col = selected_ranges[0]
         
         if self.table_model.merge_cells(start_row, start_col, end_row, end_col):
-            self.table_editor.refresh_table()
-            self.update_preview()
-            self.statusbar.showMessage("Cells merged")
+            self._schedule_refresh()
+            self._set_status("Cells merged")
         else:
-            self.statusbar.showMessage("Cannot merge selected cells")
+            self._set_status("Cannot merge selected cells")
     
     def unmerge_selected_cells(self):
         selected_ranges = self.table_editor.get_selected_ranges()
         if not selected_ranges:
-            self.statusbar.showMessage("No cells selected")
+            self._set_status("No cells selected")
             return
         
         start_row, start_col, _, _ = selected_ranges[0]
         
         if self.table_model.unmerge_cells(start_row, start_col):
-            self.table_editor.refresh_table()
-            self.update_preview()
-            self.statusbar.showMessage("Cells unmerged")
+            self._schedule_refresh()
+            self._set_status("Cells unmerged")
         else:
-            self.statusbar.showMessage("No merged cells at selection")
+            self._set_status("No merged cells at selection")
     
     def update_preview(self):
-        from core.latex_generator import LaTeXGenerator
+        """Schedule a preview update; restarting the timer collapses rapid changes into one"""
+        self._preview_timer.start()
+    
+    def _schedule_refresh(self):
+        """Refresh the table view and preview once control returns to the event loop"""
+        self._refresh_timer.start()
+    
+    def _do_refresh(self):
+        if self._is_hidden():
+            self._refresh_pending = True
+            return
+        self._refresh_pending = False
+        self.table_editor.refresh_table()
+        self._preview_timer.stop()
+        self._do_update_preview()
+    
+    def _do_update_preview(self):
+        if self.preview_widget is None:
+            # Not created yet; _init_preview_widget renders the current state
+            return
+        if self._is_hidden():
+            # Nobody can see the preview; showEvent catches up
+            self._preview_dirty = True
+            return
+        self._preview_dirty = False
         
-        # Use styled generator if custom style is set
-        if self.current_table_style:
-            generator = LaTeXGenerator(self.table_model, self.current_table_style)
-            latex_code = generator.generate("styled")
-        else:
-            generator = LaTeXGenerator(self.table_model)
-            latex_code = generator.generate("tabular")  # Default style
+        latex_code = self._current_latex()
         
+        # Unchanged state returns the same string; changes such as toggling a
+        # format twice can also produce identical output
+        if latex_code == self._last_latex:
+            return
+        self._last_latex = latex_code
         self.preview_widget.update_preview(latex_code)
     
+    def _current_latex(self) -> str:
+        """LaTeX for the current table and style, regenerated only when either has changed"""
+        style = self.current_table_style
+        version = self.table_model.version
+        cached = self._latex_cache
+        if cached and cached[0][0] == version and cached[0][1] is style:
+            return cached[1]
+        
+        # Use styled generator if custom style is set
+        self._generator.set_style(style)
+        if style:
+            latex_code = self._generator.generate("styled")
+        else:
+            latex_code = self._generator.generate("tabular")  # Default style
+        self._latex_cache = ((version, style), latex_code)
+        return latex_code
+    
     def toggle_headers(self):
         """Smart header toggle based on selection type"""
         selection_type, data = self.table_editor.get_selection_type()
@@ -363,76 +805,87 @@ class MainWindow(QMainWindow):
             # No selection, toggle row 0 as default
             is_header = self.table_model.toggle_row_header(0)
             action = "marked as" if is_header else "unmarked as"
-            self.statusbar.showMessage(f"Row 1 {action} header")
+            self._set_status(f"Row 1 {action} header")
             
         elif selection_type == "rows":
             # Toggle header status for selected rows
             messages = []
-            for row in data:
-                is_header = self.table_model.toggle_row_header(row)
+            for row, is_header in zip(data, self.table_model.toggle_row_headers(data)):
                 action = "marked as" if is_header else "unmarked as"
                 messages.append(f"Row {row + 1} {action} header")
-            self.statusbar.showMessage("; ".join(messages))
+            self._set_status("; ".join(messages))
             
         elif selection_type == "columns":
             # Toggle header status for selected columns
             messages = []
-            for col in data:
-                is_header = self.table_model.toggle_column_header(col)
+            for col, is_header in zip(data, self.table_model.toggle_column_headers(data)):
                 action = "marked as" if is_header else "unmarked as"
                 messages.append(f"Column {col + 1} {action} header")
-            self.statusbar.showMessage("; ".join(messages))
+            self._set_status("; ".join(messages))
             
         elif selection_type == "cells":
             # Toggle header status for individual cells
             # Check if any selected cell is currently a header
+            get_cell = self.table_model.get_cell
             any_header = any(
-                self.table_model.get_cell(row, col) and self.table_model.get_cell(row, col).is_header
+                (cell := get_cell(row, col)) is not None and cell.is_header
                 for row, col in data
             )
             # Toggle to opposite state
             self.table_model.set_cells_as_header(data, not any_header)
             action = "marked as" if not any_header else "unmarked as"
-            self.statusbar.showMessage(f"{len(data)} cells {action} headers")
+            self._set_status(f"{len(data)} cells {action} headers")
             
         elif selection_type == "mixed":
             # Handle mixed selection
             messages = []
-            for row in data.get("rows", []):
-                is_header = self.table_model.toggle_row_header(row)
+            rows = data.get("rows", [])
+            for row, is_header in zip(rows, self.table_model.toggle_row_headers(rows)):
                 action = "marked as" if is_header else "unmarked as"
                 messages.append(f"Row {row + 1} {action} header")
-            for col in data.get("columns", []):
-                is_header = self.table_model.toggle_column_header(col)
+            cols = data.get("columns", [])
+            for col, is_header in zip(cols, self.table_model.toggle_column_headers(cols)):
                 action = "marked as" if is_header else "unmarked as"
                 messages.append(f"Column {col + 1} {action} header")
             if data.get("cells", []):
+                get_cell = self.table_model.get_cell
                 any_header = any(
-                    self.table_model.get_cell(row, col) and self.table_model.get_cell(row, col).is_header
+                    (cell := get_cell(row, col)) is not None and cell.is_header
                     for row, col in data["cells"]
                 )
                 self.table_model.set_cells_as_header(data["cells"], not any_header)
                 action = "marked as" if not any_header else "unmarked as"
                 messages.append(f"{len(data['cells'])} cells {action} headers")
-            self.statusbar.showMessage("; ".join(messages))
+            self._set_status("; ".join(messages))
         
-        self.table_editor.refresh_table()
-        self.update_preview()
+        self._schedule_refresh()
     
     def clear_all_headers(self):
         """Clear all header formatting from the table (DEPRECATED)"""
         self.table_model.clear_all_headers()
-        self.table_editor.refresh_table()
-        self.update_preview()
-        self.statusbar.showMessage("All header selections cleared")
+        self._schedule_refresh()
+        self._set_status("All header selections cleared")
     
     def on_header_spec_changed(self):
-        """Called when header specification text changes"""
+        """Called when header specification typing pauses or editing finishes"""
+        self._header_spec_timer.stop()
         try:
             # Update the table model with new specifications
             rows_spec = self.header_rows_input.text().strip()
             cols_spec = self.header_cols_input.text().strip()
             
+            # Edits that leave the specifications as they were (e.g. whitespace) change nothing
+            if (rows_spec, cols_spec) == self._last_header_specs:
+                return
+            
+            # Keep the current headers while a specification is incomplete, e.g. "1-" mid-typing
+            invalid_specs = [spec for spec in (rows_spec, cols_spec)
+                             if not _HEADER_SPEC_RE.fullmatch(spec)]
+            if invalid_specs:
+                self._set_status(f"Invalid header specification: {', '.join(invalid_specs)}")
+                return
+            self._last_header_specs = (rows_spec, cols_spec)
+            
             self.table_model.set_header_rows_spec(rows_spec)
             self.table_model.set_header_cols_spec(cols_spec)
             
@@ -450,7 +903,7 @@ class MainWindow(QMainWindow):
                     status_parts.append(f"Invalid rows: {[r+1 for r in invalid_rows]}")
                 if invalid_cols:
                     status_parts.append(f"Invalid columns: {[c+1 for c in invalid_cols]}")
-                self.statusbar.showMessage(f"Warning: {'; '.join(status_parts)}")
+                self._set_status(f"Warning: {'; '.join(status_parts)}")
             else:
                 # Valid specification
                 status_parts = []
@@ -460,33 +913,35 @@ class MainWindow(QMainWindow):
                     status_parts.append(f"Header columns: {[c+1 for c in header_cols]}")
                 
                 if status_parts:
-                    self.statusbar.showMessage("; ".join(status_parts))
+                    self._set_status("; ".join(status_parts))
                 else:
-                    self.statusbar.showMessage("No headers specified")
+                    self._set_status("No headers specified")
             
             # Refresh display
-            self.table_editor.refresh_table()
-            self.update_preview()
+            self._schedule_refresh()
             
         except Exception as e:
-            self.statusbar.showMessage(f"Header specification error: {str(e)}")
+            self._set_status(f"Header specification error: {str(e)}")
     
     def clear_header_specifications(self):
         """Clear header specifications and reset input boxes"""
-        self.header_rows_input.clear()
-        self.header_cols_input.clear()
+        # Update the model once below instead of via textChanged for each box
+        with QSignalBlocker(self.header_rows_input), QSignalBlocker(self.header_cols_input):
+            self.header_rows_input.clear()
+            self.header_cols_input.clear()
+        self._header_spec_timer.stop()
+        self._last_header_specs = ("", "")
         self.table_model.set_header_rows_spec("")
         self.table_model.set_header_cols_spec("")
         
-        self.table_editor.refresh_table()
-        self.update_preview()
-        self.statusbar.showMessage("Header specifications cleared")
+        self._schedule_refresh()
+        self._set_status("Header specifications cleared")
     
     def toggle_font_style(self, style: str):
         """Toggle font style for selected cells"""
         selected_ranges = self.table_editor.get_selected_ranges()
         if not selected_ranges:
-            self.statusbar.showMessage("No cells selected")
+            self._set_status("No cells selected")
             return
         
         # Determine current state for the first selected cell
@@ -496,47 +951,33 @@ class MainWindow(QMainWindow):
         if style == "bold":
             # Toggle bold state
             new_state = not (first_cell and first_cell.is_bold)
-            for start_row, start_col, end_row, end_col in selected_ranges:
-                for row in range(start_row, end_row + 1):
-                    for col in range(start_col, end_col + 1):
-                        self.table_model.set_cell_font_style(row, col, "bold" if new_state else "normal")
+            self.table_model.set_range_font_style(selected_ranges, "bold" if new_state else "normal")
             
         elif style == "italic":
             # Toggle italic state
             new_state = not (first_cell and first_cell.is_italic)
-            for start_row, start_col, end_row, end_col in selected_ranges:
-                for row in range(start_row, end_row + 1):
-                    for col in range(start_col, end_col + 1):
-                        self.table_model.set_cell_font_style(row, col, "italic" if new_state else "normal")
+            self.table_model.set_range_font_style(selected_ranges, "italic" if new_state else "normal")
             
         elif style == "roman":
             # Set to normal/roman style
-            for start_row, start_col, end_row, end_col in selected_ranges:
-                for row in range(start_row, end_row + 1):
-                    for col in range(start_col, end_col + 1):
-                        self.table_model.set_cell_font_style(row, col, "normal")
+            self.table_model.set_range_font_style(selected_ranges, "normal")
         
-        self.table_editor.refresh_table()
-        self.update_preview()
+        self._schedule_refresh()
         self.update_font_button_states()
-        self.statusbar.showMessage(f"Applied {style} formatting to selected cells")
+        self._set_status(f"Applied {style} formatting to selected cells")
     
     def reset_font_formatting(self):
         """Reset font formatting for selected cells"""
         selected_ranges = self.table_editor.get_selected_ranges()
         if not selected_ranges:
-            self.statusbar.showMessage("No cells selected")
+            self._set_status("No cells selected")
             return
         
-        for start_row, start_col, end_row, end_col in selected_ranges:
-            for row in range(start_row, end_row + 1):
-                for col in range(start_col, end_col + 1):
-                    self.table_model.reset_cell_formatting(row, col)
+        self.table_model.reset_range_formatting(selected_ranges)
         
-        self.table_editor.refresh_table()
-        self.update_preview()
+        self._schedule_refresh()
         self.update_font_button_states()
-        self.statusbar.showMessage("Reset font formatting for selected cells")
+        self._set_status("Reset font formatting for selected cells")
     
     def update_font_button_states(self):
         """Update font button states based on current selection"""
@@ -549,21 +990,7 @@ class MainWindow(QMainWindow):
             return
         
         # Check if all selected cells have the same formatting
-        has_bold = False
-        has_italic = False
-        has_normal = False
-        
-        for start_row, start_col, end_row, end_col in selected_ranges:
-            for row in range(start_row, end_row + 1):
-                for col in range(start_col, end_col + 1):
-                    cell = self.table_model.get_cell(row, col)
-                    if cell:
-                        if cell.is_bold:
-                            has_bold = True
-                        if cell.is_italic:
-                            has_italic = True
-                        if cell.font_style == "normal":
-                            has_normal = True
+        has_bold, has_italic, has_normal = self.table_model.get_range_font_states(selected_ranges)
         
         # Update button states
         self.bold_btn.setChecked(has_bold)
@@ -572,259 +999,91 @@ class MainWindow(QMainWindow):
     
     def apply_theme(self):
         """Apply the current theme to the entire application"""
+        if self._applied_theme == self.dark_theme:
+            # Re-setting the same sheet would still re-polish every widget
+            return
+        self._applied_theme = self.dark_theme
+        
         if self.dark_theme:
             # Dark theme
-            self.setStyleSheet("""
-                QMainWindow {
-                    background-color: #2b2b2b;
-                    color: #ffffff;
-                }
-                QWidget {
-                    background-color: #2b2b2b;
-                    color: #ffffff;
-                }
-                QMenuBar {
-                    background-color: #3c3c3c;
-                    color: #ffffff;
-                    border-bottom: 1px solid #555555;
-                }
-                QMenuBar::item {
-                    background-color: transparent;
-                    padding: 4px 8px;
-                }
-                QMenuBar::item:selected {
-                    background-color: #555555;
-                }
-                QMenu {
-                    background-color: #3c3c3c;
-                    color: #ffffff;
-                    border: 1px solid #555555;
-                }
-                QMenu::item:selected {
-                    background-color: #555555;
-                }
-                QToolBar {
-                    background-color: #3c3c3c;
-                    border: 1px solid #555555;
-                    color: #ffffff;
-                }
-                QStatusBar {
-                    background-color: #3c3c3c;
-                    color: #ffffff;
-                    border-top: 1px solid #555555;
-                }
-                QPushButton {
-                    background-color: #404040;
-                    color: #ffffff;
-                    border: 1px solid #666666;
-                    padding: 5px 10px;
-                    border-radius: 3px;
-                }
-                QPushButton:hover {
-                    background-color: #505050;
-                }
-                QPushButton:pressed {
-                    background-color: #606060;
-                }
-                QSpinBox, QComboBox {
-                    background-color: #404040;
-                    color: #ffffff;
-                    border: 1px solid #666666;
-                    padding: 2px;
-                }
-                QSpinBox::up-button, QSpinBox::down-button {
-                    background-color: #505050;
-                    border: 1px solid #666666;
-                }
-                QComboBox::drop-down {
-                    background-color: #505050;
-                    border: 1px solid #666666;
-                }
-                QComboBox QAbstractItemView {
-                    background-color: #404040;
-                    color: #ffffff;
-                    selection-background-color: #555555;
-                }
-                QLabel {
-                    color: #ffffff;
-                }
-                QCheckBox {
-                    color: #ffffff;
-                    spacing: 5px;
-                }
-                QCheckBox::indicator {
-                    width: 18px;
-                    height: 18px;
-                    border: 2px solid #666666;
-                    border-radius: 3px;
-                    background-color: #404040;
-                }
-                QCheckBox::indicator:unchecked {
-                    background-color: #404040;
-                    border: 2px solid #666666;
-                }
-                QCheckBox::indicator:checked {
-                    background-color: #4CAF50;
-                    border: 2px solid #4CAF50;
-                    image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iOSIgdmlld0JveD0iMCAwIDEyIDkiIGZpbGw9Im5vbmUiIHhtbG5zPSJodHRwOi8vd3d3LnczLm9yZy8yMDAwL3N2ZyI+CjxwYXRoIGQ9Ik0xMC42IDEuNEw0LjQgNy42TDEuNCA0LjYiIHN0cm9rZT0id2hpdGUiIHN0cm9rZS13aWR0aD0iMiIgc3Ryb2tlLWxpbmVjYXA9InJvdW5kIiBzdHJva2UtbGluZWpvaW49InJvdW5kIi8+Cjwvc3ZnPgo=);
-                    image-position: center;
-                }
-                QCheckBox::indicator:hover {
-                    border: 2px solid #777777;
-                }
-                QCheckBox::indicator:disabled {
-                    background-color: #2b2b2b;
-                    border: 2px solid #555555;
-                }
-            """)
+            QApplication.instance().setPalette(self._dark_palette)
+            self.setStyleSheet(_DARK_QSS)
         else:
             # Light theme
-            self.setStyleSheet("""
-                QMainWindow {
-                    background-color: #ffffff;
-                    color: #000000;
-                }
-                QWidget {
-                    background-color: #ffffff;
-                    color: #000000;
-                }
-                QMenuBar {
-                    background-color: #f0f0f0;
-                    color: #000000;
-                    border-bottom: 1px solid #cccccc;
-                }
-                QMenuBar::item:selected {
-                    background-color: #e0e0e0;
-                }
-                QMenu {
-                    background-color: #ffffff;
-                    color: #000000;
-                    border: 1px solid #cccccc;
-                }
-                QMenu::item:selected {
-                    background-color: #e0e0e0;
-                }
-                QToolBar {
-                    background-color: #f0f0f0;
-                    border: 1px solid #cccccc;
-                    color: #000000;
-                }
-                QStatusBar {
-                    background-color: #f0f0f0;
-                    color: #000000;
-                    border-top: 1px solid #cccccc;
-                }
-                QPushButton {
-                    background-color: #ffffff;
-                    color: #000000;
-                    border: 1px solid #cccccc;
-                    padding: 5px 10px;
-                    border-radius: 3px;
-                }
-                QPushButton:hover {
-                    background-color: #f0f0f0;
-                }
-                QPushButton:pressed {
-                    background-color: #e0e0e0;
-                }
-                QSpinBox, QComboBox {
-                    background-color: #ffffff;
-                    color: #000000;
-                    border: 1px solid #cccccc;
-                    padding: 2px;
-                }
-                QLabel {
-                    color: #000000;
-                }
-                QCheckBox {
-                    color: #000000;
-                    spacing: 5px;
-                }
-                QCheckBox::indicator {
-                    width: 18px;
-                    height: 18px;
-                    border: 2px solid #cccccc;
-                    border-radius: 3px;
-                    background-color: #ffffff;
-                }
-                QCheckBox::indicator:unchecked {
-                    background-color: #ffffff;
-                    border: 2px solid #cccccc;
-                }
-                QCheckBox::indicator:checked {
-                    background-color: #4CAF50;
-                    border: 2px solid #4CAF50;
-                    image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iOSIgdmlld0JveD0iMCAwIDEyIDkiIGZpbGw9Im5vbmUiIHhtbG5zPSJodHRwOi8vd3d3LnczLm9yZy8yMDAwL3N2ZyI+CjxwYXRoIGQ9Ik0xMC42IDEuNEw0LjQgNy42TDEuNCA0LjYiIHN0cm9rZT0id2hpdGUiIHN0cm9rZS13aWR0aD0iMiIgc3Ryb2tlLWxpbmVjYXA9InJvdW5kIiBzdHJva2UtbGluZWpvaW49InJvdW5kIi8+Cjwvc3ZnPgo=);
-                    image-position: center;
-                }
-                QCheckBox::indicator:hover {
-                    border: 2px solid #aaaaaa;
-                }
-                QCheckBox::indicator:disabled {
-                    background-color: #f0f0f0;
-                    border: 2px solid #dddddd;
-                }
-            """)
+            QApplication.instance().setPalette(self._light_palette)
+            self.setStyleSheet(_LIGHT_QSS)
         
         # Apply theme to table editor
         if hasattr(self, 'table_editor'):
             self.table_editor.set_theme(self.dark_theme)
     
+    def _load_settings(self) -> dict:
+        """Read settings.json once; later loads and saves use the cached dict"""
+        if self._settings_cache is None:
+            settings = {}
+            try:
+                config_file = Path.home() / ".latex_table_builder" / "settings.json"
+                if config_file.exists():
+                    settings = _loads_settings(config_file.read_bytes())
+            except Exception as e:
+                logger.warning("Error loading settings: %s", e)
+            self._settings_cache = settings
+        return self._settings_cache
+    
     def load_theme_preference(self) -> bool:
         """Load saved theme preference"""
-        try:
-            from pathlib import Path
-            import json
-            
-            config_file = Path.home() / ".latex_table_builder" / "settings.json"
-            if config_file.exists():
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    settings = json.load(f)
-                    return settings.get("dark_theme", True)  # Default to dark
-        except Exception as e:
-            print(f"Error loading theme preference: {e}")
-        
-        return True  # Default to dark theme
+        return self._load_settings().get("dark_theme", True)  # Default to dark
     
     def save_theme_preference(self):
+        """Schedule a save of the theme preference; a burst of toggles writes the file once"""
+        self._save_timer.start()
+    
+    def _do_save_theme_preference(self):
         """Save current theme preference"""
+        temp_file = None
         try:
-            from pathlib import Path
-            import json
+            # Update theme setting in the cached dict; the file is never re-read
+            settings = self._load_settings()
+            settings["dark_theme"] = self.dark_theme
             
             config_dir = Path.home() / ".latex_table_builder"
             config_dir.mkdir(exist_ok=True)
             config_file = config_dir / "settings.json"
             
-            # Load existing settings or create new
-            settings = {}
-            if config_file.exists():
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    settings = json.load(f)
-            
-            # Update theme setting
-            settings["dark_theme"] = self.dark_theme
-            
-            # Save settings
-            with open(config_file, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=2)
+            # Write a temporary file and rename it over the old one, so a failed write never truncates it
+            temp_file = config_file.with_name(config_file.name + ".tmp")
+            data = _dumps_settings(settings)
+            with open(temp_file, 'wb') as f:
+                f.write(data)
+            os.replace(temp_file, config_file)
                 
-        except Exception as e:
-            print(f"Error saving theme preference: {e}")
+        except Exception:
+            logger.exception("Error saving theme preference")
+            # Don't leave a partial temporary file behind
+            if temp_file is not None:
+                try:
+                    temp_file.unlink()
+                except OSError:
+                    pass
     
     def toggle_dark_theme(self):
         """Switch to dark theme"""
+        if self.dark_theme:
+            # Already dark; nothing to restyle or save
+            return
         self.dark_theme = True
         self.apply_theme()
         self.save_theme_preference()
-        self.statusbar.showMessage("Switched to dark theme")
+        self._set_status("Switched to dark theme")
     
     def toggle_light_theme(self):
         """Switch to light theme"""
+        if not self.dark_theme:
+            return
         self.dark_theme = False
         self.apply_theme()
         self.save_theme_preference()
-        self.statusbar.showMessage("Switched to light theme")
+        self._set_status("Switched to light theme")
     
     def open_style_dialog(self):
         """Open the table style configuration dialog"""
@@ -835,7 +1094,7 @@ class MainWindow(QMainWindow):
             self.current_table_style = dialog.get_result_style()
             self.update_style_label()
             self.update_preview()
-            self.statusbar.showMessage(f"Applied style: {self.current_table_style.name}")
+            self._set_status(f"Applied style: {self.current_table_style.name}")
     
     def update_style_label(self):
         """Update the current style label"""
@@ -845,30 +1104,22 @@ class MainWindow(QMainWindow):
             self.current_style_label.setText("Current: Default")
     
     def copy_to_clipboard(self):
-        from utils.clipboard import copy_to_clipboard, save_to_temp_file, get_clipboard_status
-        from core.latex_generator import LaTeXGenerator
-        from PySide6.QtWidgets import QMessageBox
-        
-        # Use the same logic as preview
-        if self.current_table_style:
-            generator = LaTeXGenerator(self.table_model, self.current_table_style)
-            latex_code = generator.generate("styled")
-        else:
-            generator = LaTeXGenerator(self.table_model)
-            latex_code = generator.generate("tabular")
+        # Usually the code the preview was just rendered from
+        latex_code = self._current_latex()
         
-        result = copy_to_clipboard(latex_code)
+        result = _copy_text(latex_code)
         
         if result["success"]:
             method = result["method"]
             if result["fallback_used"]:
-                self.statusbar.showMessage(f"LaTeX code copied using {method} (fallback method)")
+                self._set_status(f"LaTeX code copied using {method} (fallback method)")
             else:
-                self.statusbar.showMessage("LaTeX code copied to clipboard")
+                self._set_status("LaTeX code copied to clipboard")
         else:
-            # Clipboard failed, offer alternatives
-            temp_file = save_to_temp_file(latex_code)
+            # Clipboard failed, offer alternatives; save the file while the clipboard is diagnosed
+            temp_file_future = self._get_io_pool().submit(save_to_temp_file, latex_code)
             clipboard_status = get_clipboard_status()
+            temp_file = temp_file_future.result()
             
             msg = QMessageBox()
             msg.setIcon(QMessageBox.Warning)
@@ -887,7 +1138,7 @@ class MainWindow(QMainWindow):
                 msg.setInformativeText("Please install clipboard support or manually copy from the preview panel.")
             
             msg.exec()
-            self.statusbar.showMessage("Clipboard operation failed - see message for details")
+            self._set_status("Clipboard operation failed - see message for details")
     
     def paste_from_clipboard(self):
         """Handle paste operation - delegate to table editor"""
@@ -895,9 +1146,8 @@ class MainWindow(QMainWindow):
     
     def new_table(self):
         self.table_model.clear()
-        self.table_editor.refresh_table()
-        self.update_preview()
-        self.statusbar.showMessage("New table created")
+        self._schedule_refresh()
+        self._set_status("New table created")
     
     def open_file(self):
         pass
@@ -907,10 +1157,11 @@ class MainWindow(QMainWindow):
     
     
     def show_system_info(self):
-        from PySide6.QtWidgets import QMessageBox
-        from utils.clipboard import get_clipboard_status
-        import subprocess
-        import sys
+        # Run the external tool probes side by side; on a cold cache each forks and may wait on a timeout
+        io_pool = self._get_io_pool()
+        latex_future = io_pool.submit(_probe_tool, 'pdflatex')
+        imagemagick_future = io_pool.submit(get_imagemagick_info)
+        clipboard_status = get_clipboard_status()
         
         # Check system capabilities
         info = []
@@ -918,28 +1169,22 @@ class MainWindow(QMainWindow):
         info.append(f"Platform: {sys.platform}")
         
         # Check LaTeX
-        try:
-            result = subprocess.run(['pdflatex', '--version'], 
-                                  capture_output=True, timeout=5)
-            if result.returncode == 0:
-                latex_version = result.stdout.decode().split('\n')[0]
-                info.append(f"LaTeX: {latex_version}")
-            else:
-                info.append("LaTeX: Not available")
-        except:
+        latex_version = latex_future.result()
+        if latex_version:
+            info.append(f"LaTeX: {latex_version}")
+        elif latex_version is None:
             info.append("LaTeX: Not installed")
+        else:
+            info.append("LaTeX: Not available")
         
         # Check ImageMagick using smart detection
-        from utils.imagemagick_detector import get_imagemagick_info
-        
-        imagemagick_info = get_imagemagick_info()
+        imagemagick_info = imagemagick_future.result()
         if imagemagick_info:
             info.append(f"ImageMagick: {imagemagick_info.display_name}")
         else:
             info.append("ImageMagick: Not installed")
         
         # Check clipboard
-        clipboard_status = get_clipboard_status()
         if clipboard_status["available"]:
             info.append(f"Clipboard: Available ({clipboard_status['method']})")
         else:
@@ -952,69 +1197,20 @@ class MainWindow(QMainWindow):
         msg.exec()
     
     def show_installation_guide(self):
-        from PySide6.QtWidgets import QMessageBox
-        
-        guide = """LaTeX Table Builder - Installation Guide
-
-MINIMAL INSTALLATION (for preview only):
-Download size: ~150-200MB
-
-• Ubuntu/Debian: sudo apt-get install texlive-latex-base texlive-latex-recommended texlive-fonts-recommended imagemagick
-• Fedora: sudo dnf install texlive-latex ImageMagick  
-• Arch: sudo pacman -S texlive-core imagemagick
-• macOS: brew install --cask basictex && brew install imagemagick
-
-FULL INSTALLATION (for document creation):
-• Ubuntu/Debian: sudo apt-get install texlive-latex-base texlive-latex-extra texlive-fonts-recommended
-• Fedora: sudo dnf install texlive-latex texlive-latex-extra
-• macOS: brew install --cask mactex
-• Windows: Install MiKTeX or TeX Live
-
-CLIPBOARD SUPPORT (Linux only):
-• Install xclip: sudo apt-get install xclip
-• Or install xsel: sudo apt-get install xsel
-• Quick fix: ./fix_clipboard.sh
-
-QUICK SETUP:
-• LaTeX: ./install_minimal_latex.sh
-• Clipboard: ./fix_clipboard.sh
-
-What you get with minimal installation:
-✓ LaTeX table preview in the application
-✓ PDF generation for basic tables
-✓ All standard table packages (tabular, booktabs, etc.)
-
-You DON'T need the full LaTeX installation unless you plan to:
-• Create complete LaTeX documents outside this application
-• Use advanced LaTeX packages not related to tables
-
-After installation, restart the application to detect new tools."""
-        
-        msg = QMessageBox()
-        msg.setWindowTitle("Installation Guide")
-        msg.setText("Installation Instructions")
-        msg.setDetailedText(guide)
-        msg.exec()
+        self._show_cached_message("guide", "Installation Guide", "Installation Instructions",
+                                  detailed_text=_INSTALL_GUIDE_TEXT)
     
     def show_about(self):
-        from PySide6.QtWidgets import QMessageBox
-        
-        about_text = """LaTeX Table Builder v0.1.0
-
-A cross-platform LaTeX table builder with modern GUI interface.
-
-Features:
-• Spreadsheet-like table editor with merged cell support
-• Multiple LaTeX formats (tabular, longtable, booktabs, array)
-• Live LaTeX preview
-• One-click clipboard export
-• Table preset save/load functionality
-
-Developed with Python and PySide6/Qt.
-
-For more information, see the README file."""
-        
-        msg = QMessageBox()
-        msg.setWindowTitle("About LaTeX Table Builder")
-        msg.setText(about_text)
-        msg.exec()
\ No newline at end of file
+        self._show_cached_message("about", "About LaTeX Table Builder", _ABOUT_TEXT)
+    
+    def _show_cached_message(self, key: str, title: str, text: str, detailed_text: str = None):
+        """Show a static information box, building it on first use and reusing it afterwards"""
+        msg = self._dialogs.get(key)
+        if msg is None:
+            msg = QMessageBox()
+            msg.setWindowTitle(title)
+            msg.setText(text)
+            if detailed_text:
+                msg.setDetailedText(detailed_text)
+            self._dialogs[key] = msg
+        msg.exec()
@@ -1,92 +1,368 @@
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, 
-                               QPushButton, QLabel, QScrollArea, QSplitter, QSlider, QSpinBox)
-from PySide6.QtCore import Qt, QThread, Signal
-from PySide6.QtGui import QFont, QPixmap, QPainter
+                               QPushButton, QLabel, QScrollArea, QSplitter, QSlider, QSpinBox,
+                               QFileDialog, QMessageBox)
+from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer, Signal
+from PySide6.QtGui import QFont, QFontDatabase, QImage, QPixmap, QPainter
+import atexit
 import tempfile
 import os
 import subprocess
+import hashlib
+import math
+import shutil
+import signal
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
+from utils.clipboard import copy_to_clipboard, save_to_temp_file, get_clipboard_status
+from utils.imagemagick_detector import get_convert_command, is_imagemagick_available
+from utils.latex_packages import get_safe_latex_document_bytes
 
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
 
-class LaTeXRenderThread(QThread):
-    render_finished = Signal(str, bool)  # image_path, success
+
+# Rendered previews keyed by a hash of the complete LaTeX document
+_CACHE_DIR = Path.home() / ".latex_table_builder" / "cache"
+_CACHE_MAX_ENTRIES = 200
+
+# 100% zoom shows the image at _REFERENCE_DPI; renders use less when the zoom doesn't need it
+_REFERENCE_DPI = 300
+_MIN_DPI = 150
+
+
+def _render_dpi(zoom_factor: float) -> int:
+    """Rasterization DPI for a zoom level, with 20% headroom, in steps of 50 to limit cache variants"""
+    dpi = math.ceil(_REFERENCE_DPI * zoom_factor * 1.2 / 50) * 50
+    return max(_MIN_DPI, min(dpi, _REFERENCE_DPI))
+
+
+def _evict_old_cache_entries():
+    """Delete the least recently used cached previews beyond _CACHE_MAX_ENTRIES"""
+    try:
+        entries = [entry for entry in os.scandir(_CACHE_DIR)
+                   if entry.name.endswith(".png") and entry.is_file()]
+        if len(entries) <= _CACHE_MAX_ENTRIES:
+            return
+        # Hits bump the mtime, so it doubles as a last-used time
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in entries[:len(entries) - _CACHE_MAX_ENTRIES]:
+            os.remove(entry.path)
+    except OSError as e:
+        print(f"Preview cache cleanup error: {e}")
+
+
+# Preambles dumped into pdflatex formats with mylatexformat, named by a hash of the preamble
+_FORMAT_DIR = Path.home() / ".latex_table_builder" / "fmt"
+_format_lock = threading.Lock()
+_format_attempted = set()  # Format names built (or tried) by this process
+
+
+def _format_name(preamble: str) -> str:
+    return "preview-" + hashlib.blake2b(preamble.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def _build_format(preamble: str, name: str):
+    """Dump a preamble into NAME.fmt so later runs skip loading its packages"""
+    with _format_lock:
+        if name in _format_attempted:
+            return
+        _format_attempted.add(name)
+    
+    try:
+        _FORMAT_DIR.mkdir(parents=True, exist_ok=True)
+        # Build beside the final location so the finished format can be renamed into place
+        with tempfile.TemporaryDirectory(dir=_FORMAT_DIR) as build_dir:
+            preamble_file = Path(build_dir) / "preamble.tex"
+            preamble_file.write_text(preamble + "\\begin{document}\n\\end{document}\n", encoding='utf-8')
+            result = subprocess.run(
+                ['pdftex', '-ini', '-interaction=batchmode', f'-jobname={name}',
+                 '&pdflatex', 'mylatexformat.ltx', preamble_file.name],
+                cwd=build_dir,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=60
+            )
+            fmt_file = Path(build_dir) / f"{name}.fmt"
+            if result.returncode == 0 and fmt_file.exists():
+                os.replace(fmt_file, _FORMAT_DIR / f"{name}.fmt")
+    except (OSError, subprocess.SubprocessError) as e:
+        # Missing pdftex or mylatexformat just means renders keep loading the preamble
+        print(f"LaTeX format build error: {e}")
+
+
+@lru_cache(maxsize=None)
+def _work_dir() -> Path:
+    """Scratch directory reused by every render of this process; renders run one at a time"""
+    work_dir = Path(tempfile.mkdtemp(prefix="latex_preview_"))
+    atexit.register(shutil.rmtree, work_dir, ignore_errors=True)
+    return work_dir
+
+
+@lru_cache(maxsize=None)
+def _latex_availability():
+    """Which preview tools are missing; installs don't change within a session, so checked once"""
+    missing = []
+    
+    # A PATH lookup instead of running pdflatex --version
+    if shutil.which('pdflatex') is None:
+        missing.append("pdflatex (LaTeX)")
+    
+    # PyMuPDF rasterizes in-process; otherwise check for ImageMagick using smart detection
+    if fitz is None and not is_imagemagick_available():
+        missing.append("ImageMagick (convert/magick command) or PyMuPDF")
     
-    def __init__(self, latex_code: str):
+    return {
+        "available": len(missing) == 0,
+        "missing": missing
+    }
+
+
+def _rasterize_pdf(pdf_file: Path, png_file: Path, dpi: int = _REFERENCE_DPI) -> QImage:
+    """Render the first PDF page in-process, cropped to its content like convert -trim; also saved as PNG"""
+    with fitz.open(str(pdf_file)) as doc:
+        page = doc.load_page(0)
+        # Crop in vector space so only the table area is rasterized; invisible text doesn't count
+        rects = [fitz.Rect(rect) for kind, rect in page.get_bboxlog() if kind != "ignore-text"]
+        clip = None
+        if rects:
+            # 1pt margin keeps anti-aliased edges; never reach outside the page
+            clip = fitz.Rect(min(r.x0 for r in rects) - 1, min(r.y0 for r in rects) - 1,
+                             max(r.x1 for r in rects) + 1, max(r.y1 for r in rects) + 1) & page.rect
+            if clip.is_empty:
+                clip = None
+        zoom = dpi / 72
+        pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), clip=clip, alpha=False)
+        pix.save(str(png_file), output="png")
+        # Wrap the raw RGB samples directly; copy() detaches from the pixmap's buffer
+        return QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format_RGB888).copy()
+
+
+class RenderSignals(QObject):
+    """Carries results from render jobs on pool threads back to the GUI thread"""
+    render_finished = Signal(int, QImage, bool)  # job id, image, success
+
+
+class LaTeXRenderJob(QRunnable):
+    def __init__(self, job_id: int, latex_code: str, signals: RenderSignals, is_current,
+                 dpi: int = _REFERENCE_DPI):
         super().__init__()
+        self.job_id = job_id
         self.latex_code = latex_code
+        self.dpi = dpi
+        self.signals = signals
+        # Returns False once a newer job has been submitted; checked before each expensive step
+        self._is_current = is_current
+        # (preamble, format name) to dump after a successful render without a format
+        self._format_request = None
+        # Child process currently running for this job, killed by cancel()
+        self._proc = None
+        self._proc_lock = threading.Lock()
+        self._cancelled = False
+    
+    def cancel(self):
+        """Kill this job's running pdflatex/convert; called from the GUI thread when superseded"""
+        with self._proc_lock:
+            self._cancelled = True
+            if self._proc is not None and self._proc.poll() is None:
+                self._kill_proc(self._proc)
+    
+    @staticmethod
+    def _kill_proc(proc):
+        try:
+            if os.name == 'posix':
+                # The whole session, so Ghostscript started by convert goes too
+                os.killpg(proc.pid, signal.SIGKILL)
+            else:
+                proc.kill()
+        except OSError:
+            pass  # Already exited
+    
+    def _run(self, command, **kwargs) -> int:
+        """Run a child process that cancel() can kill; returns its exit code"""
+        if self._cancelled:
+            return -1
+        # Fork/exec outside the lock so a cancel() from the GUI thread never waits on it
+        proc = subprocess.Popen(
+            command,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+            **kwargs
+        )
+        with self._proc_lock:
+            self._proc = proc
+            if self._cancelled:
+                # Cancelled while the process was starting
+                self._kill_proc(proc)
+        try:
+            return proc.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            self._kill_proc(proc)
+            proc.wait()
+            raise
     
     def run(self):
+        if not self._is_current(self.job_id):
+            return  # Superseded while queued
         try:
-            success, image_path = self._render_latex()
-            self.render_finished.emit(image_path, success)
+            success, image = self._render_latex()
+            self.signals.render_finished.emit(self.job_id, image, success)
         except Exception as e:
             print(f"LaTeX rendering error: {e}")
-            self.render_finished.emit("", False)
+            self.signals.render_finished.emit(self.job_id, QImage(), False)
+            return
+        
+        # The preview is already shown; speed up the next renders of this preamble
+        # without holding up the render queue
+        if self._format_request:
+            threading.Thread(target=_build_format, args=self._format_request, daemon=True).start()
+    
+    def _run_pdflatex(self, tex_file: Path, temp_dir: str, fmt_name=None) -> bool:
+        # batchmode: nothing is echoed to the terminal (the log file still has it);
+        # halt-on-error: a broken table fails at the first error instead of limping on
+        command = ['pdflatex', '-interaction=batchmode', '-halt-on-error']
+        env = None
+        if fmt_name:
+            command.append(f'-fmt={fmt_name}')
+            # Search our format directory first, then the default locations
+            env = dict(os.environ, TEXFORMATS=f"{_FORMAT_DIR}{os.pathsep}")
+        command.append(str(tex_file))
+        
+        returncode = self._run(command, cwd=temp_dir, env=env)
+        return returncode == 0 and tex_file.with_suffix(".pdf").exists()
     
     def _render_latex(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            tex_file = temp_path / "table.tex"
-            pdf_file = temp_path / "table.pdf"
-            png_file = temp_path / "table.png"
+        """Compile and rasterize, returning (success, image); PNG decoding happens here, off the GUI thread"""
+        # Use smart package detection to only include available packages; the
+        # surrounding document is encoded once, only the table changes per render
+        document = get_safe_latex_document_bytes(self.latex_code)
+        
+        # Identical documents render to identical images; reuse an earlier one
+        key = hashlib.blake2b(f"{self.dpi}\n".encode('ascii') + document, digest_size=16).hexdigest()
+        cached_png = _CACHE_DIR / f"{key}.png"
+        if cached_png.exists():
+            try:
+                os.utime(cached_png)  # Mark as recently used for eviction
+            except OSError:
+                pass
+            image = QImage(str(cached_png))
+            if not image.isNull():
+                return True, image
+        
+        if not self._is_current(self.job_id):
+            return False, QImage()
+        
+        temp_dir = str(_work_dir())
+        temp_path = Path(temp_dir)
+        
+        tex_file = temp_path / "table.tex"
+        pdf_file = temp_path / "table.pdf"
+        # The previous render's PDF must not pass for this one's
+        pdf_file.unlink(missing_ok=True)
+        
+        tex_file.write_bytes(document)
+        
+        # A format dumped from this preamble skips re-loading its packages
+        preamble, has_body, _ = document.partition(b"\\begin{document}")
+        preamble = preamble.decode('utf-8')
+        fmt_name = _format_name(preamble) if has_body else None
+        fmt_file = _FORMAT_DIR / f"{fmt_name}.fmt" if fmt_name else None
+        use_format = fmt_file is not None and fmt_file.exists()
+        
+        try:
+            compiled = self._run_pdflatex(tex_file, temp_dir, fmt_name if use_format else None)
+            if not compiled and use_format:
+                # A stale format (e.g. after a TeX upgrade) fails every run; retry without it
+                compiled = self._run_pdflatex(tex_file, temp_dir)
+                if compiled:
+                    fmt_file.unlink(missing_ok=True)
+            if not compiled:
+                # A run halted mid-write can leave an .aux that breaks the next one
+                tex_file.with_suffix(".aux").unlink(missing_ok=True)
+                return False, QImage()
+            if fmt_name and not use_format:
+                self._format_request = (preamble, fmt_name)
             
-            # Use smart package detection to only include available packages
-            from utils.latex_packages import get_safe_latex_document
-            complete_latex = get_safe_latex_document(self.latex_code)
+            if not self._is_current(self.job_id):
+                return False, QImage()
             
-            with open(tex_file, 'w', encoding='utf-8') as f:
-                f.write(complete_latex)
+            # Rasterize straight into the cache directory, then rename, so readers never
+            # see a partial PNG and nothing is copied
+            _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            png_file = cached_png.with_name(f"{key}.{os.getpid()}.tmp")
             
-            try:
-                result = subprocess.run(
-                    ['pdflatex', '-interaction=nonstopmode', str(tex_file)],
-                    cwd=temp_dir,
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
-                
-                if result.returncode != 0 or not pdf_file.exists():
-                    return False, ""
-                
-                # Use smart ImageMagick detection for optimal command pattern
-                from utils.imagemagick_detector import get_convert_command
-                
-                convert_cmd = get_convert_command(str(pdf_file), str(png_file))
+            if fitz is not None:
+                # Rasterize in-process; no convert/Ghostscript processes
+                image = _rasterize_pdf(pdf_file, png_file, self.dpi)
+            else:
+                # Use smart ImageMagick detection for optimal command pattern;
+                # the png: prefix picks the format despite the .tmp suffix
+                convert_cmd = get_convert_command(
+                    str(pdf_file), f"png:{png_file}",
+                    ['-density', str(self.dpi), '-quality', '100', '-trim', '+repage'])
                 if not convert_cmd:
-                    return False, ""
+                    return False, QImage()
                 
-                convert_result = subprocess.run(
-                    convert_cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
-                
-                if convert_result.returncode != 0 or not png_file.exists():
-                    return False, ""
-                
-                final_png = Path.home() / ".latex_table_builder" / "preview.png"
-                final_png.parent.mkdir(exist_ok=True)
-                
-                import shutil
-                shutil.copy2(png_file, final_png)
-                
-                return True, str(final_png)
-                
-            except (subprocess.TimeoutExpired, FileNotFoundError) as e:
-                print(f"LaTeX compilation error: {e}")
-                return False, ""
+                if self._run(convert_cmd) != 0 or not png_file.exists():
+                    png_file.unlink(missing_ok=True)
+                    return False, QImage()
+                image = QImage(str(png_file))
+            
+            if image.isNull():
+                png_file.unlink(missing_ok=True)
+                return False, image
+            
+            os.replace(png_file, cached_png)
+            _evict_old_cache_entries()
+            
+            return True, image
+            
+        except (subprocess.TimeoutExpired, FileNotFoundError) as e:
+            print(f"LaTeX compilation error: {e}")
+            return False, QImage()
 
 
 class PreviewWidget(QWidget):
     def __init__(self):
         super().__init__()
         self.current_latex = ""
-        self.render_thread = None
+        # One render at a time; queued jobs that were superseded skip themselves
+        self._render_pool = QThreadPool(self)
+        self._render_pool.setMaxThreadCount(1)
+        self._render_signals = RenderSignals(self)
+        self._render_signals.render_finished.connect(self._on_render_finished)
+        self._current_job_id = 0
+        self._active_job = None  # Latest submitted job, cancelled when superseded
+        # Renders wait for a pause in updates; only the latest LaTeX is rendered
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(250)
+        self._debounce.timeout.connect(self._do_render)
+        self._pending_latex = ""
+        self._last_rendered = None  # (latex, dpi) of the last submitted render
+        # LaTeX and DPI of the current job, and of the image on display
+        self._job_latex = None
+        self._job_dpi = _REFERENCE_DPI
+        self._displayed_latex = None
+        self._displayed_dpi = _REFERENCE_DPI
+        # Size of the displayed image at 100% zoom, and its smoothly scaled copies by zoom
+        self._ref_size = None
+        self._scaled_cache = OrderedDict()
+        # Smooth rescale once a slider drag pauses; drag ticks use a fast scale
+        self._zoom_settle_timer = QTimer(self)
+        self._zoom_settle_timer.setSingleShot(True)
+        self._zoom_settle_timer.setInterval(30)
+        self._zoom_settle_timer.timeout.connect(self._scale_pixmap_to_fit)
+        # Probe the preview tools off the GUI thread before the first render needs them
+        threading.Thread(target=_latex_availability, daemon=True).start()
         self.zoom_factor = 1.0  # Current zoom level
-        self.original_pixmap = None
+        self.original_image = None  # Kept as RGB888; the output has no transparency
         self.setup_ui()
     
     def setup_ui(self):
@@ -186,7 +462,6 @@ class PreviewWidget(QWidget):
         self.code_edit.setMaximumHeight(200)
         
         # Use a monospace font that supports Japanese characters
-        from PySide6.QtGui import QFontDatabase
         available_fonts = QFontDatabase.families()
         
         # Try monospace fonts that support Japanese characters
@@ -228,11 +503,22 @@ class PreviewWidget(QWidget):
     def update_preview(self, latex_code: str):
         self.current_latex = latex_code
         self.code_edit.setPlainText(latex_code)
+        self._pending_latex = latex_code
+        self._debounce.start()
+    
+    def _do_render(self):
+        latex_code = self._pending_latex
+        dpi = _render_dpi(self.zoom_factor)
+        last = self._last_rendered
+        if last and last[0] == latex_code and last[1] >= dpi:
+            # Already rendered at this resolution or better
+            return
         
         latex_status = self._check_latex_availability()
         
         if latex_status["available"]:
-            self._render_latex(latex_code)
+            self._last_rendered = (latex_code, dpi)
+            self._render_latex(latex_code, dpi)
         else:
             missing_tools = latex_status["missing"]
             error_msg = "LaTeX Preview Unavailable\n\n"
@@ -256,53 +542,60 @@ class PreviewWidget(QWidget):
             """)
     
     def _check_latex_availability(self):
-        missing = []
-        
-        try:
-            subprocess.run(['pdflatex', '--version'], 
-                         capture_output=True, timeout=5)
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            missing.append("pdflatex (LaTeX)")
-        
-        # Check for ImageMagick using smart detection
-        from utils.imagemagick_detector import is_imagemagick_available
-        
-        if not is_imagemagick_available():
-            missing.append("ImageMagick (convert/magick command)")
-        
-        return {
-            "available": len(missing) == 0,
-            "missing": missing
-        }
+        return _latex_availability()
     
     def _is_latex_available(self):
         return self._check_latex_availability()["available"]
     
-    def _render_latex(self, latex_code: str):
-        if self.render_thread and self.render_thread.isRunning():
-            self.render_thread.terminate()
-            self.render_thread.wait()
-        
-        self.preview_label.setText("Rendering LaTeX...")
-        self._ensure_preview_text_readable()
+    def _render_latex(self, latex_code: str, dpi: int = _REFERENCE_DPI):
+        # Supersede any queued or running job; they bail out before their next subprocess,
+        # and the running one has its current subprocess killed
+        self._current_job_id += 1
+        if self._active_job is not None:
+            self._active_job.cancel()
+        self._job_latex = latex_code
+        self._job_dpi = dpi
+        
+        # A sharper render of the table on display replaces it quietly
+        if latex_code != self._displayed_latex:
+            self.preview_label.setText("Rendering LaTeX...")
+            self._ensure_preview_text_readable()
         self.refresh_btn.setEnabled(False)
         
-        self.render_thread = LaTeXRenderThread(latex_code)
-        self.render_thread.render_finished.connect(self._on_render_finished)
-        self.render_thread.start()
+        job = LaTeXRenderJob(self._current_job_id, latex_code, self._render_signals,
+                             self._is_current_job, dpi)
+        self._active_job = job
+        self._render_pool.start(job)
+    
+    def _is_current_job(self, job_id: int) -> bool:
+        return job_id == self._current_job_id
     
-    def _on_render_finished(self, image_path: str, success: bool):
+    def _on_render_finished(self, job_id: int, image: QImage, success: bool):
+        if job_id != self._current_job_id:
+            return  # A newer render is on its way
         self.refresh_btn.setEnabled(True)
         
-        if success and image_path and os.path.exists(image_path):
-            pixmap = QPixmap(image_path)
-            if not pixmap.isNull():
-                # Store original pixmap for resizing
-                self.original_pixmap = pixmap
+        if success:
+            # Already decoded by the render job; no file access on the GUI thread.
+            # 3 bytes per pixel instead of ARGB32's 4 (a no-op for PyMuPDF output)
+            image = image.convertToFormat(QImage.Format_RGB888)
+            if not image.isNull():
+                # Store original image for resizing
+                self.original_image = image
+                self._displayed_dpi = self._job_dpi
+                self._ref_size = image.size() * (_REFERENCE_DPI / self._job_dpi)
+                self._scaled_cache.clear()
                 
-                # Set a reasonable initial zoom (try to fit, but minimum 75%)
-                self._set_initial_zoom()
-                self._scale_pixmap_to_fit()
+                if self._job_latex == self._displayed_latex:
+                    # Same table at another resolution; keep the user's zoom
+                    self._scale_pixmap_to_fit()
+                else:
+                    self._displayed_latex = self._job_latex
+                    # Set a reasonable initial zoom (try to fit, but minimum 75%)
+                    self._set_initial_zoom()
+                    self._scale_pixmap_to_fit()
+                    # The initial zoom is set with slider signals blocked; it may need more DPI
+                    self._request_sharper_render()
             else:
                 self.preview_label.setText("Failed to load rendered image")
                 self._ensure_preview_text_readable()
@@ -312,7 +605,7 @@ class PreviewWidget(QWidget):
     
     def _set_initial_zoom(self):
         """Set a reasonable initial zoom level for new images"""
-        if not hasattr(self, 'original_pixmap') or self.original_pixmap.isNull():
+        if self.original_image is None or self.original_image.isNull():
             return
         
         # Calculate fit zoom for table content
@@ -320,7 +613,7 @@ class PreviewWidget(QWidget):
         available_width = available_size.width() - 60  # More margin for better fit
         available_height = available_size.height() - 60
         
-        original_size = self.original_pixmap.size()
+        original_size = self._reference_size()
         
         scale_x = available_width / original_size.width()
         scale_y = available_height / original_size.height()
@@ -341,25 +634,33 @@ class PreviewWidget(QWidget):
         self.zoom_label.setText(f"{initial_zoom}%")
         
         # Center the content after initial load
-        from PySide6.QtCore import QTimer
         QTimer.singleShot(100, self._center_content)
     
-    def _scale_pixmap_to_fit(self):
+    def _scale_pixmap_to_fit(self, smooth: bool = True):
         """Scale the pixmap based on current zoom level"""
-        if not hasattr(self, 'original_pixmap') or self.original_pixmap.isNull():
+        if self.original_image is None or self.original_image.isNull():
             return
         
-        # Calculate target size based on zoom factor
-        original_size = self.original_pixmap.size()
-        target_width = int(original_size.width() * self.zoom_factor)
-        target_height = int(original_size.height() * self.zoom_factor)
-        
-        # Scale with high quality
-        scaled_pixmap = self.original_pixmap.scaled(
-            target_width, target_height,
-            Qt.KeepAspectRatio,
-            Qt.SmoothTransformation
-        )
+        key = round(self.zoom_factor, 2)
+        scaled_pixmap = self._scaled_cache.get(key)
+        if scaled_pixmap is not None:
+            self._scaled_cache.move_to_end(key)
+        else:
+            # Calculate target size based on zoom factor
+            original_size = self._reference_size()
+            target_width = int(original_size.width() * self.zoom_factor)
+            target_height = int(original_size.height() * self.zoom_factor)
+            
+            # Scale with high quality, or quickly for intermediate drag positions
+            scaled_pixmap = QPixmap.fromImage(self.original_image.scaled(
+                target_width, target_height,
+                Qt.KeepAspectRatio,
+                Qt.SmoothTransformation if smooth else Qt.FastTransformation
+            ))
+            if smooth:
+                self._scaled_cache[key] = scaled_pixmap
+                if len(self._scaled_cache) > 4:
+                    self._scaled_cache.popitem(last=False)
         
         self.preview_label.setPixmap(scaled_pixmap)
         
@@ -375,10 +676,27 @@ class PreviewWidget(QWidget):
         old_zoom = self.zoom_factor
         self.zoom_factor = value / 100.0
         self.zoom_label.setText(f"{value}%")
-        self._scale_pixmap_to_fit()
+        if self.zoom_slider.isSliderDown():
+            self._scale_pixmap_to_fit(smooth=False)
+            self._zoom_settle_timer.start()
+        else:
+            self._scale_pixmap_to_fit()
         
         # Restore center point after zoom
         self._restore_center_point(old_zoom)
+        
+        self._request_sharper_render()
+    
+    def _request_sharper_render(self):
+        """If the zoom is past what the image was rasterized for, render a sharper one once zooming settles"""
+        if (self.original_image is not None and self._displayed_latex
+                and _render_dpi(self.zoom_factor) > self._displayed_dpi):
+            self._pending_latex = self.current_latex
+            self._debounce.start()
+    
+    def _reference_size(self):
+        """Size of the displayed image at 100% zoom, whatever DPI it was rasterized at"""
+        return self._ref_size
     
     def _preserve_center_point(self):
         """Store the current center point of the view"""
@@ -406,7 +724,6 @@ class PreviewWidget(QWidget):
             return
         
         # Wait for the widget to update its size
-        from PySide6.QtCore import QTimer
         QTimer.singleShot(10, self._do_restore_center_point)
     
     def _do_restore_center_point(self):
@@ -446,7 +763,7 @@ class PreviewWidget(QWidget):
     
     def fit_to_window(self):
         """Fit the image to the available window space and center the table content"""
-        if not hasattr(self, 'original_pixmap') or self.original_pixmap.isNull():
+        if self.original_image is None or self.original_image.isNull():
             return
         
         # Get available size (subtract scrollbar space and margins)
@@ -455,7 +772,7 @@ class PreviewWidget(QWidget):
         available_width = available_size.width() - 60  # More margin for better fit
         available_height = available_size.height() - 60
         
-        original_size = self.original_pixmap.size()
+        original_size = self._reference_size()
         
         # Calculate scale factor to fit comfortably with padding
         scale_x = available_width / original_size.width()
@@ -477,12 +794,11 @@ class PreviewWidget(QWidget):
         self.zoom_slider.setValue(zoom_percentage)
         
         # Center the content after a brief delay to ensure scaling is complete
-        from PySide6.QtCore import QTimer
         QTimer.singleShot(50, self._center_content)
     
     def _center_content(self):
         """Center the table content in the scroll area"""
-        if not hasattr(self, 'original_pixmap') or self.original_pixmap.isNull():
+        if self.original_image is None or self.original_image.isNull():
             return
         
         # Get the scroll area and content sizes
@@ -500,7 +816,11 @@ class PreviewWidget(QWidget):
     
     def refresh_preview(self):
         if self.current_latex:
-            self.update_preview(self.current_latex)
+            # Explicit refresh: render now, even if this LaTeX was rendered before
+            self._debounce.stop()
+            self._pending_latex = self.current_latex
+            self._last_rendered = None
+            self._do_render()
     
     def toggle_view(self):
         if self.code_widget.isVisible():
@@ -511,9 +831,6 @@ class PreviewWidget(QWidget):
             self.toggle_btn.setText("Hide Code")
     
     def copy_code(self):
-        from utils.clipboard import copy_to_clipboard, save_to_temp_file, get_clipboard_status
-        from PySide6.QtWidgets import QMessageBox
-        
         result = copy_to_clipboard(self.current_latex)
         
         if result["success"]:
@@ -544,8 +861,6 @@ class PreviewWidget(QWidget):
             msg.exec()
     
     def save_code(self):
-        from PySide6.QtWidgets import QFileDialog
-        
         filename, _ = QFileDialog.getSaveFileName(
             self,
             "Save LaTeX Code",
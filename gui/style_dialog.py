@@ -9,7 +9,13 @@ from dataclasses import dataclass, asdict
 from typing import Dict, Any
 
 
-@dataclass
+# Style option values -> combo box indexes
+_LINE_STYLE_INDEX = {"single": 0, "double": 1}
+_FONT_INDEX = {"normal": 0, "bold": 1, "italic": 2}
+_ALIGNMENT_INDEX = {'left': 0, 'center': 1, 'right': 2, 'justify': 3, 'paragraph': 4}
+
+
+@dataclass(slots=True)
 class TableStyle:
     """Data class to hold all table styling options"""
     name: str = "Default"
@@ -253,9 +259,8 @@ class StyleConfigDialog(QDialog):
         self.header_columns_check.setChecked(style.header_columns_thick)
         
         # Map style names to combo indexes (single=0, double=1)
-        style_map = {"single": 0, "double": 1}
-        self.header_rows_style_combo.setCurrentIndex(style_map.get(style.header_rows_style, 1))  # Default to double
-        self.header_columns_style_combo.setCurrentIndex(style_map.get(style.header_columns_style, 1))  # Default to double
+        self.header_rows_style_combo.setCurrentIndex(_LINE_STYLE_INDEX.get(style.header_rows_style, 1))  # Default to double
+        self.header_columns_style_combo.setCurrentIndex(_LINE_STYLE_INDEX.get(style.header_columns_style, 1))  # Default to double
         
         # Borders
         self.top_bottom_borders_check.setChecked(style.top_bottom_borders)
@@ -266,9 +271,8 @@ class StyleConfigDialog(QDialog):
         self.title_edit.setText(style.title_text)
         
         # Font defaults
-        font_map = {"normal": 0, "bold": 1, "italic": 2}
-        self.header_font_combo.setCurrentIndex(font_map.get(style.header_default_font, 1))  # Default to bold
-        self.data_font_combo.setCurrentIndex(font_map.get(style.data_default_font, 0))  # Default to normal
+        self.header_font_combo.setCurrentIndex(_FONT_INDEX.get(style.header_default_font, 1))  # Default to bold
+        self.data_font_combo.setCurrentIndex(_FONT_INDEX.get(style.data_default_font, 0))  # Default to normal
         
         # Enable/disable controls
         self.header_rows_style_combo.setEnabled(style.header_rows_thick)
@@ -405,12 +409,9 @@ class StyleConfigDialog(QDialog):
         
         # Alignment section
         if hasattr(self, 'align_combo'):
-            alignment_map = {
-                'left': 0, 'center': 1, 'right': 2,
-                'justify': 3, 'paragraph': 4
-            }
-            if hasattr(style, 'default_alignment') and style.default_alignment in alignment_map:
-                self.align_combo.setCurrentIndex(alignment_map[style.default_alignment])
+            index = _ALIGNMENT_INDEX.get(getattr(style, 'default_alignment', None))
+            if index is not None:
+                self.align_combo.setCurrentIndex(index)
     
     def accept(self):
         """Accept dialog and return current style"""
@@ -1,10 +1,76 @@
 from PySide6.QtWidgets import (QTableWidget, QTableWidgetItem, QHeaderView, 
                                QAbstractItemView, QApplication, QMessageBox, QStyledItemDelegate, QLineEdit)
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QSignalBlocker
 from PySide6.QtGui import QFont, QColor, QPalette
 from core.table_model import TableModel
 
 
+# Model alignment code -> item text alignment
+_TEXT_ALIGNMENTS = {
+    'l': Qt.AlignLeft | Qt.AlignVCenter,
+    'c': Qt.AlignCenter,
+    'r': Qt.AlignRight | Qt.AlignVCenter,
+}
+
+# Table stylesheets, chosen by TableEditor.apply_theme
+_DARK_TABLE_QSS = """
+QTableWidget {
+    background-color: #2b2b2b;
+    color: #ffffff;
+    gridline-color: #555555;
+    selection-background-color: #505050;
+    selection-color: #ffffff;
+}
+QTableWidget::item {
+    background-color: #2b2b2b;
+    color: #ffffff;
+    border: 1px solid #555555;
+}
+QTableWidget::item:selected {
+    background-color: #505050;
+    color: #ffffff;
+}
+QTableWidget::item:hover {
+    background-color: #404040;
+}
+QHeaderView::section {
+    background-color: #3c3c3c;
+    color: #ffffff;
+    border: 1px solid #555555;
+    padding: 4px;
+}
+"""
+
+
+_LIGHT_TABLE_QSS = """
+QTableWidget {
+    background-color: #ffffff;
+    color: #000000;
+    gridline-color: #cccccc;
+    selection-background-color: #316AC5;
+    selection-color: #ffffff;
+}
+QTableWidget::item {
+    background-color: #ffffff;
+    color: #000000;
+    border: 1px solid #cccccc;
+}
+QTableWidget::item:selected {
+    background-color: #316AC5;
+    color: #ffffff;
+}
+QTableWidget::item:hover {
+    background-color: #e6f3ff;
+}
+QHeaderView::section {
+    background-color: #f0f0f0;
+    color: #000000;
+    border: 1px solid #cccccc;
+    padding: 4px;
+}
+"""
+
+
 class JapaneseInputDelegate(QStyledItemDelegate):
     """Custom delegate that properly supports Japanese IME input"""
     
@@ -58,15 +124,17 @@ class TableEditor(QTableWidget):
     cell_changed = Signal(int, int, str)
     toggle_headers_requested = Signal()
     
-    def __init__(self, table_model: TableModel):
+    def __init__(self, table_model: TableModel, populate: bool = True):
+        """Pass populate=False to defer filling the cells until the first refresh_table()"""
         super().__init__()
         self.table_model = table_model
         self.dark_theme = True  # Track current theme
-        self.setup_table()
+        self._populated = False
+        self.setup_table(populate)
         self.connect_signals()
         self.apply_theme()
         
-    def setup_table(self):
+    def setup_table(self, populate: bool = True):
         self.setRowCount(self.table_model.rows)
         self.setColumnCount(self.table_model.cols)
         
@@ -112,126 +180,76 @@ class TableEditor(QTableWidget):
         
         self.setAlternatingRowColors(True)
         
-        self.populate_table()
+        if populate:
+            self.populate_table()
+            self._populated = True
         
     def apply_theme(self):
         """Apply the current theme to the table"""
         if self.dark_theme:
             # Dark theme
-            self.setStyleSheet("""
-                QTableWidget {
-                    background-color: #2b2b2b;
-                    color: #ffffff;
-                    gridline-color: #555555;
-                    selection-background-color: #505050;
-                    selection-color: #ffffff;
-                }
-                QTableWidget::item {
-                    background-color: #2b2b2b;
-                    color: #ffffff;
-                    border: 1px solid #555555;
-                }
-                QTableWidget::item:selected {
-                    background-color: #505050;
-                    color: #ffffff;
-                }
-                QTableWidget::item:hover {
-                    background-color: #404040;
-                }
-                QHeaderView::section {
-                    background-color: #3c3c3c;
-                    color: #ffffff;
-                    border: 1px solid #555555;
-                    padding: 4px;
-                }
-            """)
+            self.setStyleSheet(_DARK_TABLE_QSS)
         else:
             # Light theme
-            self.setStyleSheet("""
-                QTableWidget {
-                    background-color: #ffffff;
-                    color: #000000;
-                    gridline-color: #cccccc;
-                    selection-background-color: #316AC5;
-                    selection-color: #ffffff;
-                }
-                QTableWidget::item {
-                    background-color: #ffffff;
-                    color: #000000;
-                    border: 1px solid #cccccc;
-                }
-                QTableWidget::item:selected {
-                    background-color: #316AC5;
-                    color: #ffffff;
-                }
-                QTableWidget::item:hover {
-                    background-color: #e6f3ff;
-                }
-                QHeaderView::section {
-                    background-color: #f0f0f0;
-                    color: #000000;
-                    border: 1px solid #cccccc;
-                    padding: 4px;
-                }
-            """)
+            self.setStyleSheet(_LIGHT_TABLE_QSS)
     
     def set_theme(self, dark_theme: bool):
         """Switch between dark and light theme"""
+        if dark_theme == self.dark_theme:
+            return
         self.dark_theme = dark_theme
         self.apply_theme()
-        self.refresh_table()  # Refresh to update cell colors
+        if self._populated:
+            self.refresh_table()  # Refresh to update cell colors
         
     def connect_signals(self):
         self.cellChanged.connect(self.on_cell_changed)
         
     def populate_table(self):
+        # Bind per-call constants and bound methods once; this runs for every cell on each refresh
+        get_cell = self.table_model.get_cell
+        set_item = self.setItem
+        set_span = self.setSpan
+        if self.dark_theme:
+            header_bg = QColor(70, 80, 100)  # Dark blue for headers
+            text_fg = QColor(255, 255, 255)  # White text
+            merged_bg = QColor(60, 70, 90)  # Dark merged cell color
+            merged_part_bg = QColor(45, 45, 45)  # Dark gray for merged parts
+        else:
+            header_bg = QColor(230, 240, 250)  # Light blue for headers
+            text_fg = QColor(0, 0, 0)  # Black text
+            merged_bg = QColor(240, 248, 255)  # Light merged cell color
+            merged_part_bg = QColor(245, 245, 245)  # Light gray for merged parts
+        bold_font = QTableWidgetItem().font()
+        bold_font.setBold(True)
+        
         for row in range(self.table_model.rows):
             for col in range(self.table_model.cols):
-                cell = self.table_model.get_cell(row, col)
+                cell = get_cell(row, col)
                 if cell and not cell.is_merged_part:
                     item = QTableWidgetItem(cell.content)
                     
-                    if cell.alignment == 'l':
-                        item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-                    elif cell.alignment == 'c':
-                        item.setTextAlignment(Qt.AlignCenter)
-                    elif cell.alignment == 'r':
-                        item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                    text_alignment = _TEXT_ALIGNMENTS.get(cell.alignment)
+                    if text_alignment is not None:
+                        item.setTextAlignment(text_alignment)
                     
                     # Style header cells
                     if cell.is_header or cell.is_bold:
-                        font = item.font()
-                        font.setBold(True)
-                        item.setFont(font)
-                        if self.dark_theme:
-                            item.setBackground(QColor(70, 80, 100))  # Dark blue for headers
-                            item.setForeground(QColor(255, 255, 255))  # White text
-                        else:
-                            item.setBackground(QColor(230, 240, 250))  # Light blue for headers
-                            item.setForeground(QColor(0, 0, 0))  # Black text
-                    else:
-                        # Set default colors for non-header cells
-                        if self.dark_theme:
-                            item.setForeground(QColor(255, 255, 255))  # White text
-                        else:
-                            item.setForeground(QColor(0, 0, 0))  # Black text
+                        item.setFont(bold_font)
+                        item.setBackground(header_bg)
+                    item.setForeground(text_fg)
                     
-                    self.setItem(row, col, item)
+                    set_item(row, col, item)
                     
-                    if cell.span.row_span > 1 or cell.span.col_span > 1:
-                        self.setSpan(row, col, cell.span.row_span, cell.span.col_span)
-                        if self.dark_theme:
-                            item.setBackground(QColor(60, 70, 90))  # Dark merged cell color
-                        else:
-                            item.setBackground(QColor(240, 248, 255))  # Light merged cell color
+                    span = cell.span
+                    if span.row_span > 1 or span.col_span > 1:
+                        set_span(row, col, span.row_span, span.col_span)
+                        item.setBackground(merged_bg)
                 elif cell and cell.is_merged_part:
                     item = QTableWidgetItem("")
                     item.setFlags(Qt.NoItemFlags)
-                    if self.dark_theme:
-                        item.setBackground(QColor(45, 45, 45))  # Dark gray for merged parts
-                    else:
-                        item.setBackground(QColor(245, 245, 245))  # Light gray for merged parts
-                    self.setItem(row, col, item)
+                    item.setBackground(merged_part_bg)
+                    set_item(row, col, item)
     
     def refresh_table(self):
         self.clearSpans()
@@ -242,6 +260,7 @@ class TableEditor(QTableWidget):
         self.clear()
         self.populate_table()
         self.blockSignals(False)
+        self._populated = True
         
     def on_cell_changed(self, row: int, col: int):
         item = self.item(row, col)
@@ -346,11 +365,13 @@ class TableEditor(QTableWidget):
     
     def delete_selected_cells(self):
         selected_ranges = self.get_selected_ranges()
+        set_cell_content = self.table_model.set_cell_content
+        item_at = self.item
         for start_row, start_col, end_row, end_col in selected_ranges:
             for row in range(start_row, end_row + 1):
                 for col in range(start_col, end_col + 1):
-                    self.table_model.set_cell_content(row, col, "")
-                    item = self.item(row, col)
+                    set_cell_content(row, col, "")
+                    item = item_at(row, col)
                     if item:
                         item.setText("")
     
@@ -447,12 +468,15 @@ class TableEditor(QTableWidget):
                     QMessageBox.warning(self, "Resize Error", "Failed to resize table")
                     return
                 
-                # Update spinboxes in main window if available
+                # Update spinboxes in main window if available; the model is already
+                # resized, so don't let valueChanged resize it again one axis at a time
                 main_window = self.window()
                 if hasattr(main_window, 'rows_spinbox'):
-                    main_window.rows_spinbox.setValue(new_rows)
+                    with QSignalBlocker(main_window.rows_spinbox):
+                        main_window.rows_spinbox.setValue(new_rows)
                 if hasattr(main_window, 'cols_spinbox'):
-                    main_window.cols_spinbox.setValue(new_cols)
+                    with QSignalBlocker(main_window.cols_spinbox):
+                        main_window.cols_spinbox.setValue(new_cols)
             else:
                 # User declined resize, ask how to handle
                 msg2 = QMessageBox()
@@ -468,25 +492,29 @@ class TableEditor(QTableWidget):
         # Perform the paste operation
         pasted_cells = 0
         skipped_cells = 0
+        model_rows = self.table_model.rows
+        model_cols = self.table_model.cols
+        get_cell = self.table_model.get_cell
+        set_cell_content = self.table_model.set_cell_content
         
         for row_idx, row_data in enumerate(table_data):
             target_row = current_row + row_idx
-            if target_row >= self.table_model.rows:
+            if target_row >= model_rows:
                 break
                 
             for col_idx, cell_content in enumerate(row_data):
                 target_col = current_col + col_idx
-                if target_col >= self.table_model.cols:
+                if target_col >= model_cols:
                     break
                 
                 # Check if cell is part of a merged region
-                cell = self.table_model.get_cell(target_row, target_col)
+                cell = get_cell(target_row, target_col)
                 if cell and cell.is_merged_part:
                     skipped_cells += 1
                     continue
                 
                 # Set cell content
-                self.table_model.set_cell_content(target_row, target_col, cell_content)
+                set_cell_content(target_row, target_col, cell_content)
                 pasted_cells += 1
         
         # Refresh the table display
@@ -494,12 +522,12 @@ class TableEditor(QTableWidget):
         
         # Show status message
         main_window = self.window()
-        if hasattr(main_window, 'statusbar'):
+        if hasattr(main_window, '_set_status'):
             if skipped_cells > 0:
-                main_window.statusbar.showMessage(
+                main_window._set_status(
                     f"Pasted {pasted_cells} cells, skipped {skipped_cells} merged cells")
             else:
-                main_window.statusbar.showMessage(f"Pasted {pasted_cells} cells")
+                main_window._set_status(f"Pasted {pasted_cells} cells")
         
         # Emit signal to update preview
         self.cell_changed.emit(current_row, current_col, "")
@@ -582,15 +610,14 @@ class TableEditor(QTableWidget):
     
     def set_alignment(self, alignment: str):
         selected_ranges = self.get_selected_ranges()
+        self.table_model.set_range_alignment(selected_ranges, alignment)
+        text_alignment = _TEXT_ALIGNMENTS.get(alignment)
+        if text_alignment is None:
+            return
+        item_at = self.item
         for start_row, start_col, end_row, end_col in selected_ranges:
             for row in range(start_row, end_row + 1):
                 for col in range(start_col, end_col + 1):
-                    self.table_model.set_cell_alignment(row, col, alignment)
-                    item = self.item(row, col)
+                    item = item_at(row, col)
                     if item:
-                        if alignment == 'l':
-                            item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-                        elif alignment == 'c':
-                            item.setTextAlignment(Qt.AlignCenter)
-                        elif alignment == 'r':
-                            item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
\ No newline at end of file
+                        item.setTextAlignment(text_alignment)
\ No newline at end of file
@@ -2,11 +2,25 @@ import pyperclip
 import subprocess
 import tempfile
 import os
+import time
 from typing import Optional, Dict
 
 
+# Seconds a clipboard status probe stays valid
+_STATUS_TTL = 5.0
+_status_cache = None  # (monotonic timestamp, status)
+
+
 def get_clipboard_status() -> Dict[str, any]:
-    """Check clipboard availability and provide detailed status"""
+    """Check clipboard availability and provide detailed status (cached for a few seconds)"""
+    global _status_cache
+    now = time.monotonic()
+    if _status_cache is None or now - _status_cache[0] > _STATUS_TTL:
+        _status_cache = (now, _probe_clipboard_status())
+    return _status_cache[1]
+
+
+def _probe_clipboard_status() -> Dict[str, any]:
     status = {
         "available": False,
         "method": None,
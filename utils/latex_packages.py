@@ -1,7 +1,7 @@
 import subprocess
 import tempfile
 import os
-from typing import Set, Dict
+from typing import Set, Dict, Tuple
 
 
 class LaTeXPackageDetector:
@@ -10,6 +10,7 @@ class LaTeXPackageDetector:
     def __init__(self):
         self._available_packages = None
         self._tested_packages = set()
+        self._template_parts = {}  # Japanese or not -> (head, tail)
     
     def is_package_available(self, package_name: str) -> bool:
         """Check if a specific LaTeX package is available"""
@@ -66,6 +67,16 @@ Test
     
     def get_safe_latex_template(self, latex_content: str) -> str:
         """Generate a LaTeX document template with only available packages"""
+        head, tail = self.get_template_parts(self._contains_japanese_text(latex_content))
+        return head + latex_content + tail
+    
+    def get_template_parts(self, japanese: bool) -> Tuple[str, str]:
+        """Document text before and after the table content; built once per kind, since
+        package availability doesn't change"""
+        parts = self._template_parts.get(japanese)
+        if parts is not None:
+            return parts
+        
         # Start with only the most basic packages
         essential_packages = ['array']
         optional_packages = ['booktabs', 'longtable', 'multirow']
@@ -74,8 +85,8 @@ Test
         # Always include array (it's in latex-base)
         package_includes = ["\\usepackage{array}"]
         
-        # Check if Japanese text is present and add appropriate packages
-        if self._contains_japanese_text(latex_content):
+        # Add appropriate packages when Japanese text is present
+        if japanese:
             japanese_package_added = False
             # Try Japanese packages in order of preference
             for package in japanese_packages:
@@ -102,26 +113,22 @@ Test
             if self.is_package_available(package):
                 package_includes.append(f"\\usepackage{{{package}}}")
         
-        # Create document with appropriate wrapper for CJK if needed
-        if self._contains_japanese_text(latex_content) and any('CJK' in inc for inc in package_includes):
-            template = f"""\\documentclass{{article}}
+        head = f"""\\documentclass{{article}}
 {chr(10).join(package_includes)}
 \\begin{{document}}
 \\pagestyle{{empty}}
-\\begin{{CJK}}{{UTF8}}{{min}}
-{latex_content}
-\\end{{CJK}}
-\\end{{document}}
 """
-        else:
-            template = f"""\\documentclass{{article}}
-{chr(10).join(package_includes)}
-\\begin{{document}}
-\\pagestyle{{empty}}
-{latex_content}
-\\end{{document}}
+        tail = """
+\\end{document}
 """
-        return template
+        # Wrap the content in a CJK environment if needed
+        if japanese and any('CJK' in inc for inc in package_includes):
+            head += "\\begin{CJK}{UTF8}{min}\n"
+            tail = "\n\\end{CJK}" + tail
+        
+        parts = (head, tail)
+        self._template_parts[japanese] = parts
+        return parts
     
     def _contains_japanese_text(self, text: str) -> bool:
         """Check if text contains Japanese characters (Hiragana, Katakana, Kanji)"""
@@ -148,6 +155,19 @@ def get_safe_latex_document(latex_content: str) -> str:
     return _detector.get_safe_latex_template(latex_content)
 
 
+_encoded_template_parts = {}
+
+
+def get_safe_latex_document_bytes(latex_content: str) -> bytes:
+    """get_safe_latex_document, UTF-8 encoded; only the table content is encoded per call"""
+    japanese = _detector._contains_japanese_text(latex_content)
+    parts = _encoded_template_parts.get(japanese)
+    if parts is None:
+        head, tail = _detector.get_template_parts(japanese)
+        parts = _encoded_template_parts[japanese] = (head.encode('utf-8'), tail.encode('utf-8'))
+    return parts[0] + latex_content.encode('utf-8') + parts[1]
+
+
 def get_package_recommendations() -> Dict[str, str]:
     """Get package installation recommendations"""
     return {